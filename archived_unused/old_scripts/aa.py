@@ -1,6 +1,6 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+import asyncio
 import csv
-import time
 import urllib.parse
 import re
 
@@ -17,6 +17,16 @@ TEST_MODE = False  # ⬅️ set to False for full run
 MAX_SCROLLS = 2 if TEST_MODE else 20
 MAX_CURATORS = 5 if TEST_MODE else None
 WAIT_BETWEEN_SCROLLS = 1.2
+MAX_CONCURRENT = 6  # curator profiles fetched in parallel (one browser context each)
+
+FIELDNAMES = ["curator_name", "steam_profile", "followers", "recommendation", "external_site", "email"]
+
+LISTING_JS = """() => Array.from(document.querySelectorAll('div.curator_page')).map(b => ({
+  name: b.querySelector('div.name span')?.innerText.trim() || 'N/A',
+  link: b.querySelector('a.profile_avatar')?.getAttribute('href') || 'N/A',
+  followers: b.querySelector('div.followers span')?.innerText.trim() || '0',
+  rec: b.querySelector('div.curations span.review_direction')?.innerText.trim() || 'N/A'
+}))"""
 
 def extract_email_from_url(url):
     if not url:
@@ -25,59 +35,77 @@ def extract_email_from_url(url):
     match = re.search(r"mailto:([\w\.-]+@[\w\.-]+)", decoded)
     return match.group(1) if match else "N/A"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False)
-    page = browser.new_page()
-    page.goto(curator_page_url)
-
-    for i in range(MAX_SCROLLS):
-        page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-        print(f"Scrolled {i + 1} times")
-        time.sleep(WAIT_BETWEEN_SCROLLS)
-
-    curator_blocks = page.query_selector_all("div.curator_page")
-    if MAX_CURATORS:
-        curator_blocks = curator_blocks[:MAX_CURATORS]
-
-    curators = []
-    for idx, block in enumerate(curator_blocks, start=1):
-        name_el = block.query_selector("div.name span")
-        name = name_el.inner_text().strip() if name_el else "N/A"
-
-        link_el = block.query_selector("a.profile_avatar")
-        curator_link = link_el.get_attribute("href") if link_el else "N/A"
-
-        follower_el = block.query_selector("div.followers span")
-        followers = follower_el.inner_text().strip() if follower_el else "0"
-
-        rec_el = block.query_selector("div.curations span.review_direction")
-        recommendation = rec_el.inner_text().strip() if rec_el else "N/A"
-
-        external_link, email = "N/A", "N/A"
-
-        if curator_link != "N/A":
+async def fetch_external_link(browser, sem, idx, name, curator_link):
+    """Open a curator profile in its own context; return (external_link, email)."""
+    external_link, email = "N/A", "N/A"
+    async with sem:
+        context = await browser.new_context()
+        try:
+            curator_page = await context.new_page()
+            await curator_page.goto(curator_link, timeout=20000)
             try:
-                curator_page = browser.new_page()
-                curator_page.goto(curator_link, timeout=20000)
-                curator_page.wait_for_timeout(1500)
-
-                ext_link_el = curator_page.query_selector("a.curator_url")
-                if ext_link_el:
-                    external_link = ext_link_el.get_attribute("href")
-                    email = extract_email_from_url(external_link)
-
-                curator_page.close()
-                print(f"[{idx}] {name} → {email if email != 'N/A' else external_link}")
-            except Exception as e:
-                print(f"[{idx}] Failed for {name}: {e}")
-
-        curators.append([name, curator_link, followers, recommendation, external_link, email])
-
-    filename = f"curators_{APP_ID}{'_test' if TEST_MODE else ''}.csv"
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["curator_name", "steam_profile", "followers", "recommendation", "external_site", "email"])
-        writer.writerows(curators)
-
-    print(f"💾 Saved {len(curators)} curators to {filename}")
-    browser.close()
+                # returns as soon as the link renders instead of always sleeping 1.5s
+                await curator_page.wait_for_selector("a.curator_url", timeout=5000)
+            except Exception:
+                pass  # many curators have no external link
+
+            ext_link_el = await curator_page.query_selector("a.curator_url")
+            if ext_link_el:
+                external_link = await ext_link_el.get_attribute("href")
+                email = extract_email_from_url(external_link)
+
+            print(f"[{idx}] {name} → {email if email != 'N/A' else external_link}")
+        except Exception as e:
+            print(f"[{idx}] Failed for {name}: {e}")
+        finally:
+            await context.close()
+    return external_link, email
+
+async def main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False)
+        page = await browser.new_page()
+        await page.goto(curator_page_url)
+
+        for i in range(MAX_SCROLLS):
+            await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+            print(f"Scrolled {i + 1} times")
+            await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
+
+        # one round-trip for the whole listing instead of 4 query_selector calls per curator
+        curators_raw = await page.evaluate(LISTING_JS)
+        if MAX_CURATORS:
+            curators_raw = curators_raw[:MAX_CURATORS]
+
+        # stream rows to disk as profiles finish (completion order) instead of collecting them all first
+        filename = f"curators_{APP_ID}{'_test' if TEST_MODE else ''}.csv"
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+        written = 0
+        with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            writer.writeheader()
+
+            async def scrape_row(idx, c):
+                nonlocal written
+                if c["link"] != "N/A":
+                    external_link, email = await fetch_external_link(browser, sem, idx, c["name"], c["link"])
+                else:
+                    external_link, email = "N/A", "N/A"
+                writer.writerow({
+                    "curator_name": c["name"],
+                    "steam_profile": c["link"],
+                    "followers": c["followers"],
+                    "recommendation": c["rec"],
+                    "external_site": external_link,
+                    "email": email,
+                })
+                written += 1
+                if written % 50 == 0:
+                    f.flush()
+
+            await asyncio.gather(*(scrape_row(idx, c) for idx, c in enumerate(curators_raw, start=1)))
+
+        print(f"💾 Saved {written} curators to {filename}")
+        await browser.close()
+
+asyncio.run(main())
@@ -42,6 +42,65 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+# Requests aborted on every page: only text is scraped. Stylesheets are kept because innerText
+# depends on CSS visibility
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+# About-page description and the first email in it, matched in the page: one round-trip
+# instead of query_selector + inner_text + a Python regex
+ABOUT_DESC_JS = """() => {
+  const e = document.querySelector('div.about_container div.desc, div.about_container p.tagline');
+  if (!e) return null;
+  const text = e.innerText || '';
+  const m = text.match(/[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\\.[a-zA-Z0-9.-]+/);
+  return {text, email: m ? m[0] : ''};
+}"""
+# Every curator block on the listing read in one evaluate (name, profile, followers and the
+# review snippet for this appid) instead of several query_selector/inner_text awaits per block
+LISTING_JS = """(blocks, appid) => {
+  const usable = e => {
+    const t = e ? (e.innerText || '').trim() : '';
+    return t && !t.toLowerCase().includes('no more reviews') ? t.replace(/\\n/g, ' ').slice(0, 800) : '';
+  };
+  const snippet = b => {
+    // prefer the text next to a store capsule that links to this appid
+    for (const a of b.querySelectorAll('a.store_capsule, a.app_impression_tracked, a')) {
+      const ds = a.getAttribute('data-ds-appid') || '';
+      const href = a.getAttribute('href') || '';
+      if (ds === appid || href.includes('/app/' + appid) || href.includes('app=' + appid)) {
+        const t = usable(a.querySelector('div.text') || (a.parentElement && a.parentElement.querySelector('div.text')));
+        if (t) return t;
+      }
+    }
+    for (const sel of ['div.review_text', 'div.curator_review', 'div.recent_review', 'div.review_body', 'p.tagline', 'div.review', 'div.text']) {
+      const e = b.querySelector(sel);
+      if (e) {
+        const t = usable(e);
+        if (t) return t;
+      }
+    }
+    return '';
+  };
+  return blocks.map(b => {
+    const nameEl = b.querySelector('div.name span');
+    const followersEl = b.querySelector('div.followers span');
+    return {
+      name: nameEl ? nameEl.innerText.trim() : 'N/A',
+      profileLink: b.querySelector('a.profile_avatar')?.getAttribute('href') || '',
+      followers: followersEl ? followersEl.innerText.trim() : 'N/A',
+      snippet: snippet(b),
+    };
+  });
+}"""
+
+
+async def block_heavy_resources(route):
+    """Route handler: abort images/media/fonts and analytics requests, continue everything else."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def extract_email_from_text(text: str):
@@ -93,8 +152,8 @@ async def extract_email_from_link(elem):
     return href, email
 
 
-async def process_curator(curator, page_pool, appid=None, app_name=None, listing_review=None):
-    """Scrape info from a single curator block using a pooled page.
+async def process_curator(basic, page_pool, appid=None, app_name=None, listing_review=None):
+    """Scrape info for a single curator (a LISTING_JS entry) using a pooled page.
 
     Notes:
     - email fields default to empty string when not found
@@ -107,15 +166,10 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
     sample_review = ""
     reviews_count = 0
     try:
-        # Basic info (from the listing block)
-        name_elem = await curator.query_selector("div.name span")
-        name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-
-        profile_elem = await curator.query_selector("a.profile_avatar")
-        profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-
-        follower_elem = await curator.query_selector("div.followers span")
-        followers = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
+        # Basic info (already read from the listing block)
+        name = basic["name"]
+        profile_link = basic["profileLink"]
+        followers = basic["followers"]
 
         # NOTE: we intentionally drop the per-listing 'recommendation' value (not useful)
 
@@ -131,17 +185,9 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
 
         if profile_link:
             # acquire a page from the pool (this will block until available)
+            # (user-agent and navigation timeout were set once when the page joined the pool)
             page2 = await page_pool.get()
             try:
-                try:
-                    await page2.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-                except Exception:
-                    pass
-                try:
-                    await page2.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-                except Exception:
-                    pass
-
                 # Retry navigating to profile
                 for attempt in range(NAV_RETRIES + 1):
                     try:
@@ -269,12 +315,9 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
                                 else:
                                     print(f"[{name}] Timeout navigating to about page after {NAV_RETRIES+1} attempts")
 
-                        desc_el = await page2.query_selector(
-                            "div.about_container div.desc, div.about_container p.tagline"
-                        )
-                        if desc_el:
-                            text = await desc_el.inner_text()
-                            about_me = (text or "").strip()
+                        desc = await page2.evaluate(ABOUT_DESC_JS)
+                        if desc:
+                            about_me = desc["text"].strip()
                             # Aggressively remove badges/lines that look like follower/review counts or 'POSTED'
                             try:
                                 # remove lines that are just a number + label, e.g. '25,966\nCURATOR FOLLOWERS' or '1,855\nREVIEWS POSTED'
@@ -286,18 +329,14 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
                                 about_me = re.sub(r"\s+", " ", about_me).strip()
                             except Exception:
                                 pass
-                            possible_email = await extract_email_from_text(text)
-                            if possible_email:
-                                email_found = possible_email
+                            if desc["email"]:
+                                email_found = desc["email"]
             except PlaywrightTimeoutError:
                 print(f"[{name}] Timeout on profile page")
             except Exception as e:
                 print(f"[{name}] Error when visiting profile: {e}")
             finally:
-                try:
-                    await page2.goto('about:blank', timeout=5000)
-                except Exception:
-                    pass
+                # no about:blank reset: the next goto replaces the document anyway
                 await page_pool.put(page2)
 
         return {
@@ -432,6 +471,7 @@ async def main():
         page_pool = asyncio.Queue()
         for _ in range(MAX_CONCURRENT):
             ppage = await browser.new_page()
+            await ppage.route("**/*", block_heavy_resources)
             try:
                 await ppage.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
             except Exception:
@@ -445,9 +485,9 @@ async def main():
 
         # semaphore used by all workers
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-        async def sem_task(curator, appid=None, app_name=None, listing_review=None):
+        async def sem_task(key, basic, appid=None, app_name=None, listing_review=None):
             async with semaphore:
-                return await process_curator(curator, page_pool, appid=appid, app_name=app_name, listing_review=listing_review)
+                return key, await process_curator(basic, page_pool, appid=appid, app_name=app_name, listing_review=listing_review)
 
         # If aggregated was not loaded from CSV earlier, start empty
         # aggregated variable may already contain preloaded entries
@@ -458,6 +498,7 @@ async def main():
 
             # open listing page for this app id
             page = await browser.new_page()
+            await page.route("**/*", block_heavy_resources)
             try:
                 await page.set_default_navigation_timeout(NAV_TIMEOUT_MS)
             except Exception:
@@ -478,8 +519,7 @@ async def main():
                 while rounds < max_rounds:
                     await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
                     await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
-                    curator_divs = await page.query_selector_all("div.curator_page")
-                    cur_count = len(curator_divs)
+                    cur_count = await page.eval_on_selector_all("div.curator_page", "blocks => blocks.length")
                     print(f"[{app_name}] Scrolled (auto) round {rounds+1}; curators: {cur_count}")
                     if cur_count == prev_count:
                         stable_rounds += 1
@@ -495,77 +535,29 @@ async def main():
                     print(f"[{app_name}] Scrolled {i + 1} times")
                     await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
 
-            # after scrolling get the final list of curator blocks
-            curator_divs = await page.query_selector_all("div.curator_page")
-            print(f"[{app_name}] Found {len(curator_divs)} curators on page")
+            # after scrolling read every curator block in a single evaluate
+            listing = await page.eval_on_selector_all("div.curator_page", LISTING_JS, str(appid))
+            print(f"[{app_name}] Found {len(listing)} curators on page")
 
             # build tasks only for curators not already seen (keyed by steam_profile when available)
             tasks = []
-            keys = []
-            for curator in curator_divs:
-                name_elem = await curator.query_selector("div.name span")
-                name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-                profile_elem = await curator.query_selector("a.profile_avatar")
-                profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-                key = profile_link if profile_link else name
+            for basic in listing:
+                key = basic["profileLink"] or basic["name"]
                 if key in aggregated:
                     aggregated[key]["games"].add(app_name)
                     continue
-                # Try to extract a short review snippet directly from the listing block (preferred)
-                listing_snippet = ""
-                try:
-                    # First, look for store capsule anchors that reference this appid and extract their nearby text
-                    try:
-                        anchors = await curator.query_selector_all('a.store_capsule, a.app_impression_tracked, a')
-                        for a in anchors:
-                            ds_appid = await a.get_attribute('data-ds-appid') or ''
-                            ahref = await a.get_attribute('href') or ''
-                            if (ds_appid and str(ds_appid) == str(appid)) or (f"/app/{appid}" in ahref) or (f"app={appid}" in ahref):
-                                # prefer a div.text inside the anchor or its parent
-                                txt_el = await a.query_selector('div.text')
-                                if not txt_el:
-                                    # check parent node for a div.text
-                                    parent = await a.evaluate_handle('node => node.parentElement')
-                                    try:
-                                        if parent:
-                                            txt_el = await parent.as_element().query_selector('div.text')
-                                    except Exception:
-                                        txt_el = None
-                                if txt_el:
-                                    txt = (await txt_el.inner_text() or '').strip()
-                                    if txt and 'no more reviews' not in txt.lower():
-                                        listing_snippet = txt.replace('\n', ' ')[:800]
-                                        break
-                    except Exception:
-                        pass
-
-                    # fallback to existing selectors if we didn't find a targeted snippet
-                    if not listing_snippet:
-                        for sel in ["div.review_text", "div.curator_review", "div.recent_review", "div.review_body", "p.tagline", "div.review", "div.text"]:
-                            el = await curator.query_selector(sel)
-                            if el:
-                                txt = (await el.inner_text() or "").strip()
-                                if txt and 'no more reviews' not in txt.lower():
-                                    listing_snippet = txt.replace("\n", " ")[:800]
-                                    break
-                except Exception:
-                    listing_snippet = ""
-
-                tasks.append(sem_task(curator, appid, app_name, listing_review=listing_snippet))
-                keys.append(key)
-
-            results = []
-            if tasks:
-                results = await asyncio.gather(*tasks)
+                tasks.append(asyncio.create_task(sem_task(key, basic, appid, app_name, listing_review=basic["snippet"])))
 
-            # store results and attach game using the same key we checked earlier
-            for res, key in zip(results, keys):
+            # store each result (and attach the game) as soon as its profile is done instead of
+            # holding every result until the slowest one finishes
+            for done, fut in enumerate(asyncio.as_completed(tasks), start=1):
+                key, res = await fut
                 if not res:
                     continue
-                res_games = set([app_name])
-                res_record = res.copy()
-                aggregated[key] = {"data": res_record, "games": res_games}
+                aggregated[key] = {"data": res, "games": {app_name}}
                 newly_added_keys.add(key)
+                if done % 50 == 0:
+                    print(f"[{app_name}] Profiles done: {done}/{len(tasks)}")
 
             await page.close()
 
@@ -12,6 +12,10 @@ import urllib.parse
 import requests
 import argparse
 import os
+import json
+import time
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 # Support multiple games (list of Steam app ids)
@@ -19,12 +23,17 @@ from playwright.async_api import async_playwright, TimeoutError as PlaywrightTim
 RAW_GAME_IDS = ["3314790, 646570, 2379780, 3405340, 2427700"]  # keep your original entry here
 TEST_MODE = False
 MAX_SCROLLS = 2 if TEST_MODE else 20
-WAIT_BETWEEN_SCROLLS = 1.5
+SCROLL_WAIT_MS = 3000  # max wait for a scroll to load more curators; two misses in a row end the listing
 # If SCROLL_UNTIL_END is True the scraper will keep scrolling until the listing stops
 # loading new curator entries (useful for games with many curators, e.g. ~1100)
 SCROLL_UNTIL_END = False
 # output filename is computed in main after normalization of GAME_IDS
 MAX_CONCURRENT = 3  # number of parallel tabs/workers
+LISTING_CONCURRENCY = 2  # games whose curator listings are scrolled at the same time
+CHECKPOINT_EVERY = 200  # rewrite the output CSV after this many newly scraped curators
+
+# appid -> game name, so incremental runs don't ask Steam's appdetails API again
+APPNAME_CACHE_FILE = ".appname_cache.json"
 
 # Navigation / retry tuning (adjust if Steam is slow or rate-limiting you)
 NAV_TIMEOUT_MS = 30000     # 30s navigation timeout
@@ -36,45 +45,105 @@ DEFAULT_USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Compiled once: used on every curator / about page
+EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9\-]+\.[a-zA-Z0-9.\-]+", re.ASCII)
+
+# Profile/About pages and appdetails lookups go over plain HTTP with one keep-alive session
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+# Only anchors and text are read, so these never need to be downloaded
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# All listing fields for every curator block in one round-trip
+# Curators whose key (profile link, else name) is already known come back as bare keys,
+# so only new curators pay for the per-field DOM reads
+LISTING_JS = """(seen) => {
+  const known = new Set(seen);
+  const out = {known: [], fresh: []};
+  for (const c of document.querySelectorAll('div.curator_page')) {
+    const text = sel => { const el = c.querySelector(sel); return el ? el.innerText.trim() : null; };
+    const avatar = c.querySelector('a.profile_avatar');
+    const profile = avatar ? (avatar.getAttribute('href') || '') : '';
+    if (profile && known.has(profile)) { out.known.push(profile); continue; }
+    const name = text('div.name span') ?? 'N/A';
+    if (!profile && known.has(name)) { out.known.push(name); continue; }
+    out.fresh.push({
+      name,
+      profile,
+      followers: text('div.followers span') ?? 'N/A',
+      recommendation: (text('span.review_direction') ?? 'N/A').toUpperCase(),
+    });
+  }
+  return out;
+}"""
+# Remember the current number of curator blocks so LISTING_GREW_JS can tell when a scroll loaded more
+COUNT_CURATORS_JS = "window.__cnt = document.querySelectorAll('div.curator_page').length"
+LISTING_GREW_JS = "document.querySelectorAll('div.curator_page').length !== window.__cnt"
+
+
+async def block_heavy_resources(route):
+    """Route handler: abort resource types the scraper never reads."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 async def extract_email_from_text(text: str):
     """Extract the first email found in a text block.
 
     Return an empty string when no email is found (preferred for CSV sorting/filtering).
     """
-    if not text:
+    # most bios have no '@' at all: a plain substring scan rules them out before the regex runs
+    if not text or "@" not in text:
         return ""
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_RE.search(text)
     return match.group(0) if match else ""
 
 
-async def extract_email_from_link(elem):
-    """Extract email from a <a class='curator_url'> element, only the address.
+def email_from_link(href: str, text: str) -> str:
+    """Extract the email behind a <a class='curator_url'> link, only the address.
 
-    Returns (href, email) where email is empty string if not found.
+    Returns an empty string if not found.
     """
-    if not elem:
-        return "", ""
-    href = await elem.get_attribute("href") or ""
-    text = await elem.inner_text() or ""
-    email = ""
-
     # Try to extract email from the visible text
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_RE.search(text or "")
     if match:
-        email = match.group(0)
-    else:
-        # fallback: decode href
-        decoded = urllib.parse.unquote(href)
-        if "mailto:" in decoded:
-            email = decoded.split("mailto:")[-1]
-        elif "@" in decoded:
-            email = decoded
-    return href, email
+        return match.group(0)
+    # fallback: decode href
+    decoded = urllib.parse.unquote(href or "")
+    if "mailto:" in decoded:
+        return decoded.split("mailto:")[-1]
+    if "@" in decoded:
+        return decoded
+    return ""
+
+
+def fetch_html(url: str, name: str) -> str:
+    """GET a curator page over the shared HTTP session (with retries); "" on failure."""
+    for attempt in range(NAV_RETRIES + 1):
+        try:
+            resp = HTTP_SESSION.get(url, timeout=NAV_TIMEOUT_MS / 1000)
+            resp.raise_for_status()
+            return resp.text
+        except requests.Timeout:
+            if attempt < NAV_RETRIES:
+                time.sleep(NAV_RETRY_SLEEP)
+            else:
+                print(f"[{name}] Timeout fetching {url} after {NAV_RETRIES+1} attempts")
+        except requests.RequestException as e:
+            print(f"[{name}] Error fetching {url}: {e}")
+            break
+    return ""
 
 
-async def process_curator(curator, page_pool):
-    """Scrape info from a single curator block using a pooled page.
+async def process_curator(curator):
+    """Scrape info for one curator listing entry (a LISTING_JS dict).
+
+    Curator profile and About pages are server-rendered, so they are fetched with plain
+    HTTP and parsed with BeautifulSoup; Playwright is only needed for the listing.
 
     Notes:
     - email fields default to empty string when not found
@@ -85,86 +154,38 @@ async def process_curator(curator, page_pool):
     followers = "N/A"
     recommendation = "N/A"
     try:
-        # Basic info (from the listing block)
-        name_elem = await curator.query_selector("div.name span")
-        name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-
-        profile_elem = await curator.query_selector("a.profile_avatar")
-        profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-
-        follower_elem = await curator.query_selector("div.followers span")
-        followers = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
-
-        rec_elem = await curator.query_selector("span.review_direction")
-        recommendation = (await rec_elem.inner_text()).strip().upper() if rec_elem else "N/A"
+        # Basic info (already extracted from the listing block)
+        name = curator["name"]
+        profile_link = curator["profile"]
+        followers = curator["followers"]
+        recommendation = curator["recommendation"]
 
         external_site = ""
         email_found = ""  # blank means no email found
 
         if profile_link:
-            # acquire a page from the pool (this will block until available)
-            page2 = await page_pool.get()
             try:
-                try:
-                    await page2.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-                except Exception:
-                    pass
-                try:
-                    await page2.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-                except Exception:
-                    pass
-
-                # Retry navigating to profile
-                for attempt in range(NAV_RETRIES + 1):
-                    try:
-                        await page2.goto(profile_link, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                        break
-                    except PlaywrightTimeoutError:
-                        if attempt < NAV_RETRIES:
-                            await asyncio.sleep(NAV_RETRY_SLEEP)
-                        else:
-                            print(f"[{name}] Timeout navigating to profile after {NAV_RETRIES+1} attempts")
+                profile = BeautifulSoup(await asyncio.to_thread(fetch_html, profile_link, name), "lxml")
 
                 # External link under profile name
-                site_link_el = await page2.query_selector("a.curator_url.ttip")
+                site_link_el = profile.select_one("a.curator_url.ttip")
                 if site_link_el:
-                    external_site, email_from_link = await extract_email_from_link(site_link_el)
-                    if email_from_link:
-                        email_found = email_from_link
+                    external_site = site_link_el.get("href") or ""
+                    email_found = email_from_link(external_site, site_link_el.get_text())
 
                 # About page (may contain an email)
-                about_link_el = await page2.query_selector("a.about")
-                if about_link_el:
-                    about_url = await about_link_el.get_attribute("href")
-                    if about_url:
-                        for attempt in range(NAV_RETRIES + 1):
-                            try:
-                                await page2.goto(about_url, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                                break
-                            except PlaywrightTimeoutError:
-                                if attempt < NAV_RETRIES:
-                                    await asyncio.sleep(NAV_RETRY_SLEEP)
-                                else:
-                                    print(f"[{name}] Timeout navigating to about page after {NAV_RETRIES+1} attempts")
-
-                        desc_el = await page2.query_selector(
-                            "div.about_container div.desc, div.about_container p.tagline"
-                        )
-                        if desc_el:
-                            text = await desc_el.inner_text()
-                            possible_email = await extract_email_from_text(text)
-                            if possible_email:
-                                email_found = possible_email
-            except PlaywrightTimeoutError:
-                print(f"[{name}] Timeout on profile page")
+                about_link_el = profile.select_one("a.about")
+                about_url = about_link_el.get("href") if about_link_el else None
+                if about_url:
+                    about_url = urllib.parse.urljoin(profile_link, about_url)
+                    about = BeautifulSoup(await asyncio.to_thread(fetch_html, about_url, name), "lxml")
+                    desc_el = about.select_one("div.about_container div.desc, div.about_container p.tagline")
+                    if desc_el:
+                        possible_email = await extract_email_from_text(desc_el.get_text())
+                        if possible_email:
+                            email_found = possible_email
             except Exception as e:
                 print(f"[{name}] Error when visiting profile: {e}")
-            finally:
-                try:
-                    await page2.goto('about:blank', timeout=5000)
-                except Exception:
-                    pass
-                await page_pool.put(page2)
 
         return {
             "curator_name": name,
@@ -243,7 +264,7 @@ async def main():
                 if not key:
                     continue
                 games_field = (r.get('game') or '')
-                games = set([g.strip() for g in games_field.split(';') if g.strip()]) if games_field else set()
+                games = {g for g in map(str.strip, games_field.split(';')) if g} if games_field else set()
                 # normalize fields: ensure email empty string if missing
                 rec = {
                     'curator_name': name or 'N/A',
@@ -262,145 +283,200 @@ async def main():
         aggregated = load_existing_csv(args.input_csv)
         print(f"Loaded {len(aggregated)} curators from {args.input_csv}")
 
+    try:
+        with open(APPNAME_CACHE_FILE, encoding="utf-8") as fh:
+            name_cache = json.load(fh)
+    except Exception:
+        name_cache = {}
+
     def get_game_name(appid: str) -> str:
-        """Sync helper: ask Steam API for friendly name, fallback to id."""
+        """Sync helper: ask Steam API for friendly name (cached per appid), fallback to id."""
+        if str(appid) in name_cache:
+            return name_cache[str(appid)]
         try:
             url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            resp = requests.get(url, timeout=5).json()
+            resp = HTTP_SESSION.get(url, timeout=5).json()
             if resp and str(appid) in resp and resp[str(appid)].get("success"):
-                return resp[str(appid)]["data"].get("name", f"Unknown ({appid})")
+                name = resp[str(appid)]["data"].get("name", f"Unknown ({appid})")
+                name_cache[str(appid)] = name
+                return name
         except Exception:
             pass
         return f"Unknown ({appid})"
 
+    def fetch_game_names(appids) -> None:
+        """Sync helper: fill the name cache for every uncached appid with one batched appdetails call.
+
+        Anything the batch doesn't answer is left to get_game_name's per-appid lookup.
+        """
+        missing = [str(a) for a in appids if str(a) not in name_cache]
+        if len(missing) < 2:
+            return
+        try:
+            url = f"https://store.steampowered.com/api/appdetails?appids={','.join(missing)}&filters=basic"
+            resp = HTTP_SESSION.get(url, timeout=10).json() or {}
+            for appid in missing:
+                entry = resp.get(appid) or {}
+                if entry.get("success"):
+                    name_cache[appid] = entry["data"].get("name", f"Unknown ({appid})")
+        except Exception:
+            pass
+
+    def snapshot_rows() -> list:
+        """Return every aggregated curator as a CSV row tuple; call it while holding agg_lock."""
+        # plain csv.writer rows built straight from each entry (no per-row dict copies);
+        # has_email lets you sort by presence of email easily (1 has email, 0 missing)
+        rows = []
+        for entry in aggregated.values():
+            d = entry["data"]
+            rows.append((
+                d["curator_name"], d["steam_profile"], d["followers"], d.get("recommendation", ""),
+                d["external_site"], d["email"], 1 if d.get("email") else 0, ";".join(sorted(entry["games"])),
+            ))
+        return rows
+
+    def write_csv(rows) -> int:
+        """Write snapshot rows to OUTPUT_FILE (with 'game' and 'has_email' columns).
+
+        Also used for the periodic checkpoints, so the file is written to a temp name,
+        fsynced and then swapped in: a crash never leaves a half-written CSV behind.
+        """
+        fieldnames = ["curator_name", "steam_profile", "followers", "recommendation", "external_site", "email", "has_email", "game"]
+        tmp_path = f"{OUTPUT_FILE}.tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, OUTPUT_FILE)
+        return len(rows)
+
+    # checkpoints share one temp file, so writes go one at a time (in snapshot order)
+    write_lock = asyncio.Lock()
+
+    async def dump_csv(rows) -> int:
+        """Write and fsync a snapshot on a worker thread, off the event loop."""
+        async with write_lock:
+            return await asyncio.to_thread(write_csv, rows)
+
     async with async_playwright() as p:
         # Run headless so windows don't steal focus
         browser = await p.chromium.launch(headless=True)
+        # One context for every page: the user-agent (to reduce bot-detection) and the
+        # navigation timeout are set once here instead of per page
+        context = await browser.new_context(user_agent=DEFAULT_USER_AGENT)
+        context.set_default_navigation_timeout(NAV_TIMEOUT_MS)
+        await context.route("**/*", block_heavy_resources)
 
-        # Create a small pool of pages for profile visits (limits visible tabs)
-        # We set the user-agent on each pooled page to reduce bot-detection.
-        page_pool = asyncio.Queue()
-        for _ in range(MAX_CONCURRENT):
-            ppage = await browser.new_page()
-            try:
-                await ppage.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-            except Exception:
-                pass
-            try:
-                await ppage.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-            except Exception:
-                pass
-            await ppage.goto('about:blank')
-            await page_pool.put(ppage)
+        # Games are scraped concurrently; each takes a listing page from this small pool
+        listing_pages = asyncio.Queue()
+        for _ in range(min(LISTING_CONCURRENCY, len(GAME_IDS)) or 1):
+            listing_pages.put_nowait(await context.new_page())
 
         # semaphore used by all workers
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-        async def sem_task(curator):
+        async def sem_task(key, curator):
             async with semaphore:
-                return await process_curator(curator, page_pool)
+                return key, await process_curator(curator)
 
         # If aggregated was not loaded from CSV earlier, start empty
         # aggregated variable may already contain preloaded entries
-
-        for appid in GAME_IDS:
-            app_name = get_game_name(appid)
+        # keys being scraped by some game -> other games that listed the same curator meanwhile
+        in_flight = {}
+        agg_lock = asyncio.Lock()
+        completed = 0
+
+        async def scrape_game(appid):
+            nonlocal completed
+            app_name = await asyncio.to_thread(get_game_name, appid)
             curator_page_url = f"https://store.steampowered.com/curators/curatorsreviewing/?appid={appid}"
 
-            # open listing page for this app id
-            page = await browser.new_page()
-            try:
-                await page.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-            except Exception:
-                pass
+            page = await listing_pages.get()
             try:
-                await page.goto(curator_page_url, timeout=NAV_TIMEOUT_MS, wait_until="networkidle")
-            except PlaywrightTimeoutError:
-                print(f"[{app_name}] Timeout loading curator listing for appid {appid}")
-                await page.close()
-                continue
-
-            # Scroll the page according to mode
-            if SCROLL_UNTIL_END:
-                prev_count = 0
-                stable_rounds = 0
-                rounds = 0
-                max_rounds = 500  # safety cap in case site never reports stability
-                while rounds < max_rounds:
-                    await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                    await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
-                    curator_divs = await page.query_selector_all("div.curator_page")
-                    cur_count = len(curator_divs)
-                    print(f"[{app_name}] Scrolled (auto) round {rounds+1}; curators: {cur_count}")
-                    if cur_count == prev_count:
-                        stable_rounds += 1
-                        if stable_rounds >= 3:
-                            break
-                    else:
-                        stable_rounds = 0
-                        prev_count = cur_count
-                    rounds += 1
-            else:
-                for i in range(MAX_SCROLLS):
+                # load this app id's listing into a pooled listing page
+                try:
+                    await page.goto(curator_page_url, timeout=NAV_TIMEOUT_MS, wait_until="networkidle")
+                except PlaywrightTimeoutError:
+                    print(f"[{app_name}] Timeout loading curator listing for appid {appid}")
+                    return
+
+                # Scroll until the listing stops growing: after each scroll wait for new
+                # curator blocks to show up instead of sleeping a fixed interval
+                max_rounds = 500 if SCROLL_UNTIL_END else MAX_SCROLLS  # safety cap in case site never reports stability
+                await page.evaluate(COUNT_CURATORS_JS)
+                idle_rounds = 0
+                for i in range(max_rounds):
                     await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                    print(f"[{app_name}] Scrolled {i + 1} times")
-                    await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
-
-            # after scrolling get the final list of curator blocks
-            curator_divs = await page.query_selector_all("div.curator_page")
-            print(f"[{app_name}] Found {len(curator_divs)} curators on page")
+                    try:
+                        await page.wait_for_function(LISTING_GREW_JS, timeout=SCROLL_WAIT_MS)
+                        idle_rounds = 0
+                    except PlaywrightTimeoutError:
+                        idle_rounds += 1
+                    cur_count = await page.evaluate(COUNT_CURATORS_JS)
+                    print(f"[{app_name}] Scrolled {i + 1} times; curators: {cur_count}")
+                    if idle_rounds >= 2:
+                        break
 
-            # build tasks only for curators not already seen (keyed by steam_profile when available)
+                # after scrolling read every curator block in a single evaluate
+                seen = [*aggregated, *in_flight]
+                listing = await page.evaluate(LISTING_JS, seen)
+            finally:
+                # keep the page for the next game; just drop this listing's DOM
+                try:
+                    await page.goto('about:blank')
+                except Exception:
+                    pass
+                listing_pages.put_nowait(page)
+            known_keys, entries = listing["known"], listing["fresh"]
+            print(f"[{app_name}] Found {len(known_keys) + len(entries)} curators on page ({len(entries)} new)")
+
+            # build tasks only for curators not already seen (keyed by steam_profile when available);
+            # a curator another game is already scraping just gets this game added when it lands.
+            # Known keys from LISTING_JS and new entries go through the same single pass.
+            fresh = {curator["profile"] or curator["name"]: curator for curator in entries}
             tasks = []
-            keys = []
-            for curator in curator_divs:
-                name_elem = await curator.query_selector("div.name span")
-                name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-                profile_elem = await curator.query_selector("a.profile_avatar")
-                profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-                key = profile_link if profile_link else name
-                if key in aggregated:
-                    aggregated[key]["games"].add(app_name)
-                    continue
-                tasks.append(sem_task(curator))
-                keys.append(key)
+            async with agg_lock:
+                for key in (*known_keys, *fresh):
+                    if key in aggregated:
+                        aggregated[key]["games"].add(app_name)
+                    elif key in in_flight:
+                        in_flight[key].add(app_name)
+                    elif key in fresh:
+                        in_flight[key] = set()
+                        tasks.append(sem_task(key, fresh[key]))
+
+            # store each result as soon as its profile is done, under the key it was claimed with
+            for next_done in asyncio.as_completed(tasks):
+                key, res = await next_done
+                checkpoint = None
+                async with agg_lock:
+                    # the in-flight set already holds the other games; it becomes the entry's set
+                    games = in_flight.pop(key)
+                    if not res:
+                        continue
+                    games.add(app_name)
+                    aggregated[key] = {"data": res, "games": games}
+                    completed += 1
+                    # checkpoint long runs so a crash doesn't lose everything scraped so far
+                    if completed % CHECKPOINT_EVERY == 0:
+                        checkpoint = snapshot_rows()
+                # written outside agg_lock so the other games keep aggregating meanwhile
+                if checkpoint is not None:
+                    count = await dump_csv(checkpoint)
+                    print(f"Checkpoint: {count} curators written to {OUTPUT_FILE}")
+
+        await asyncio.to_thread(fetch_game_names, GAME_IDS)
+        await asyncio.gather(*(scrape_game(appid) for appid in GAME_IDS))
 
-            results = []
-            if tasks:
-                results = await asyncio.gather(*tasks)
+        try:
+            with open(APPNAME_CACHE_FILE, "w", encoding="utf-8") as fh:
+                json.dump(name_cache, fh, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Could not save game name cache: {e}")
 
-            # store results and attach game using the same key we checked earlier
-            for res, key in zip(results, keys):
-                if not res:
-                    continue
-                res_games = set([app_name])
-                res_record = res.copy()
-                aggregated[key] = {"data": res_record, "games": res_games}
-
-            await page.close()
-
-        # Close pooled pages
-        while not page_pool.empty():
-            ppage = await page_pool.get()
-            await ppage.close()
-
-        # Flatten aggregated results and write CSV with a 'game' column
-        final_rows = []
-        for key, entry in aggregated.items():
-            row = entry["data"].copy()
-            games_field = ";".join(sorted(entry["games"]))
-            row["game"] = games_field
-            # add helper column so you can sort by presence of email easily (1 has email, 0 missing)
-            row["has_email"] = 1 if row.get("email") else 0
-            final_rows.append(row)
-
-        # Save CSV (include game and has_email columns)
-        with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
-            fieldnames = ["curator_name", "steam_profile", "followers", "recommendation", "external_site", "email", "has_email", "game"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(final_rows)
-
-        print(f"💾 Saved {len(final_rows)} unique curators to {OUTPUT_FILE}")
+        count = await dump_csv(snapshot_rows())
+        print(f"💾 Saved {count} unique curators to {OUTPUT_FILE}")
         await browser.close()
 
 
@@ -70,8 +70,8 @@ async def extract_email_from_link(elem):
     return href, email
 
 # --- Async scraping functions ---
-async def process_curator(curator, browser, app_name):
-    """Process a single curator: get profile, external site, email."""
+async def process_curator(curator, page_pool, app_name):
+    """Process a single curator: get profile, external site, email (on a page from page_pool)."""
     try:
         name_elem = await curator.query_selector("div.name span")
         name = await name_elem.inner_text() if name_elem else "N/A"
@@ -89,33 +89,35 @@ async def process_curator(curator, browser, app_name):
         email_found = "N/A"
 
         if profile_link != "N/A":
-            page2 = await browser.new_page()
-            await page2.goto(profile_link)
-            await asyncio.sleep(2)
-
-            # External site / link
-            site_link_el = await page2.query_selector("a.curator_url.ttip")
-            if site_link_el:
-                external_site, email_from_link = await extract_email_from_link(site_link_el)
-                if email_from_link != "N/A":
-                    email_found = email_from_link
-
-            # About page inside curator page
-            about_link_el = await page2.query_selector("a.about")
-            if about_link_el:
-                about_url = await about_link_el.get_attribute("href")
-                if about_url:
-                    await page2.goto(about_url)
-                    await asyncio.sleep(1.5)
-                    desc_el = await page2.query_selector(
-                        "div.about_container div.desc, div.about_container p.tagline"
-                    )
-                    if desc_el:
-                        text = await desc_el.inner_text()
-                        possible_email = extract_email_from_text(text)
-                        if possible_email != "N/A":
-                            email_found = possible_email
-            await page2.close()
+            page2 = await page_pool.get()
+            try:
+                await page2.goto(profile_link)
+                await asyncio.sleep(2)
+
+                # External site / link
+                site_link_el = await page2.query_selector("a.curator_url.ttip")
+                if site_link_el:
+                    external_site, email_from_link = await extract_email_from_link(site_link_el)
+                    if email_from_link != "N/A":
+                        email_found = email_from_link
+
+                # About page inside curator page
+                about_link_el = await page2.query_selector("a.about")
+                if about_link_el:
+                    about_url = await about_link_el.get_attribute("href")
+                    if about_url:
+                        await page2.goto(about_url)
+                        await asyncio.sleep(1.5)
+                        desc_el = await page2.query_selector(
+                            "div.about_container div.desc, div.about_container p.tagline"
+                        )
+                        if desc_el:
+                            text = await desc_el.inner_text()
+                            possible_email = extract_email_from_text(text)
+                            if possible_email != "N/A":
+                                email_found = possible_email
+            finally:
+                await page_pool.put(page2)
 
         return {
             "curator_name": name,
@@ -130,7 +132,7 @@ async def process_curator(curator, browser, app_name):
         print(f"[{name if 'name' in locals() else 'UNKNOWN'}] Error processing profile: {e}")
         return None
 
-async def scrape_game(appid, browser, seen_profiles):
+async def scrape_game(appid, browser, page_pool, seen_profiles):
     """Scrape curators for a single game."""
     curators_data = []
     app_name = get_game_name(appid)
@@ -154,7 +156,7 @@ async def scrape_game(appid, browser, seen_profiles):
         name = await name_elem.inner_text() if name_elem else "N/A"
         if name in seen_profiles:
             continue
-        curator_data = await process_curator(curator, browser, app_name)
+        curator_data = await process_curator(curator, page_pool, app_name)
         if curator_data:
             curators_data.append(curator_data)
             seen_profiles.add(name)
@@ -169,7 +171,11 @@ async def main():
 
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=False)
-        tasks = [scrape_game(appid, browser, seen_profiles) for appid in APP_IDS]
+        # profile pages are checked out of a fixed pool instead of opening/closing a tab per curator
+        page_pool = asyncio.Queue()
+        for _ in range(CONCURRENT_WORKERS):
+            page_pool.put_nowait(await browser.new_page())
+        tasks = [scrape_game(appid, browser, page_pool, seen_profiles) for appid in APP_IDS]
         results = await asyncio.gather(*tasks)
         for game_data in results:
             all_data.extend(game_data)
@@ -6,27 +6,114 @@ Script to add channel descriptions to a CSV of YouTube channels.
 Input CSV columns: video_url, video_title, channel_url, channel_name
 Output CSV adds: channel_description, channel_emails
 
-Uses Playwright to visit each channel_url, click to open the About popup, and extract the information.
+Reads the description from the ytInitialData JSON embedded in each channel's /about page; when that
+JSON can't be found or parsed, falls back to Playwright: visit the channel_url, click to open the
+About popup, and extract the information.
+Channels are processed by several browser contexts in parallel (--workers); output rows keep the
+input order.
 """
 
+import asyncio
 import csv
 import argparse
+import json
 import os
 from urllib.parse import urljoin
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import re
+import requests
+try:
+    from python_src.shared.emails import EMAIL_RE
+except Exception:
+    import sys
+    repo_root = os.path.dirname(os.path.abspath(__file__))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    from python_src.shared.emails import EMAIL_RE
 
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36'
+DEFAULT_WORKERS = 5  # browser contexts visiting channels at the same time
+DEFAULT_STATE_FILE = 'outputs/yt_state.json'  # cookies/localStorage kept between runs (consent, locale)
+# Requests dropped by every browser context: the scraper only reads text. Stylesheets stay, the
+# popup fallback clicks by layout (bounding_box)
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com')
+# Full description text inside the opened About popup, read in one evaluate instead of
+# query_selector + text_content
+POPUP_DESCRIPTION_JS = """() => {
+  const e = document.querySelector('tp-yt-paper-dialog yt-attributed-string#description-container span.yt-core-attributed-string');
+  return e ? e.textContent : null;
+}"""
+YT_INITIAL_DATA_RE = re.compile(r'var ytInitialData = (\{.*?\});</script>', re.S)
+
+# One session shared by every worker's asyncio.to_thread fetch: this relies on requests'
+# connection pool (urllib3) being thread-safe for plain GETs. Headers are only set here, and
+# cookies from responses go through the cookie jar's own lock.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'en'})
+# pre-answer the cookie consent so EU requests aren't redirected to consent.youtube.com
+HTTP_SESSION.cookies.set('SOCS', 'CAI', domain='.youtube.com')
 
 
 def extract_emails(text):
     """Extract email addresses from text using regex."""
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(email_pattern, text)
+    emails = EMAIL_RE.findall(text)
     return list(set(emails))  # Remove duplicates
 
 
-def dismiss_youtube_consent(page, timeout=2000):
+def _find_key(obj, key):
+    """Depth-first search for the first value stored under key in nested dicts/lists."""
+    if isinstance(obj, dict):
+        if key in obj:
+            return obj[key]
+        obj = obj.values()
+    elif not isinstance(obj, list):
+        return None
+    for value in obj:
+        found = _find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
+
+def description_from_initial_data(html):
+    """Return the channel description from the page's ytInitialData, or None if it isn't there."""
+    m = YT_INITIAL_DATA_RE.search(html)
+    if not m:
+        return None
+    try:
+        data = json.loads(m.group(1))
+    except ValueError:
+        return None
+    about = _find_key(data, 'aboutChannelViewModel')
+    if isinstance(about, dict) and 'description' in about:
+        return about['description'] or ''
+    meta = _find_key(data, 'channelMetadataRenderer')
+    if isinstance(meta, dict) and 'description' in meta:
+        return meta['description'] or ''
+    return None
+
+
+def fetch_description(channel_url):
+    """Fetch the channel's /about page over plain HTTP and read the description from its JSON."""
+    try:
+        resp = HTTP_SESSION.get(channel_url.rstrip('/') + '/about', timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return None
+    return description_from_initial_data(resp.text)
+
+
+async def block_heavy_resources(route):
+    """Route handler: abort images/media/fonts and ad/analytics requests, continue everything else."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def dismiss_youtube_consent(page, timeout=2000):
     candidates = [
         'button:has-text("Reject all")',
         'button:has-text("Reject")',
@@ -42,16 +129,16 @@ def dismiss_youtube_consent(page, timeout=2000):
     ]
     for sel in candidates:
         try:
-            btn = page.query_selector(sel)
+            btn = await page.query_selector(sel)
             if btn:
-                btn.click()
-                page.wait_for_timeout(500)
+                await btn.click()
+                await page.wait_for_timeout(500)
                 return True
         except Exception:
             continue
     # JS fallback
     try:
-        clicked = page.evaluate(r"""
+        clicked = await page.evaluate(r"""
             () => {
                 const texts = ["reject all","reject","rechazar todo","no aceptar","no, thanks","reject all cookies"];
                 const nodes = Array.from(document.querySelectorAll('button, a, tp-yt-paper-button, ytd-button-renderer'));
@@ -67,90 +154,159 @@ def dismiss_youtube_consent(page, timeout=2000):
             }
         """)
         if clicked:
-            page.wait_for_timeout(500)
+            await page.wait_for_timeout(500)
     except Exception:
         pass
     return False
 
 
-def _expand_truncated_description(page):
+async def _expand_truncated_description(page):
     """Click to open the description popup."""
     try:
-        desc_preview = page.query_selector('yt-description-preview-view-model')
+        desc_preview = await page.query_selector('yt-description-preview-view-model')
         if desc_preview:
-            desc_preview.scroll_into_view_if_needed()
-            page.wait_for_timeout(500)
-            bbox = desc_preview.bounding_box()
+            await desc_preview.scroll_into_view_if_needed()
+            await page.wait_for_timeout(500)
+            bbox = await desc_preview.bounding_box()
             if bbox:
-                page.mouse.click(bbox['x'] + bbox['width'] / 2, bbox['y'] + bbox['height'] - 10)
+                await page.mouse.click(bbox['x'] + bbox['width'] / 2, bbox['y'] + bbox['height'] - 10)
             else:
-                desc_preview.click(force=True)
-            page.wait_for_timeout(1000)
+                await desc_preview.click(force=True)
+            await page.wait_for_timeout(1000)
             return True
     except Exception:
         pass
     return False
 
 
-def extract_description(channel_url, page):
-    """Extract description and emails from the About popup."""
+async def extract_description(channel_url, page):
+    """Extract description and emails, from the embedded JSON or else the About popup.
+
+    Expects the consent banner to be dismissed already (see run).
+    """
     info = {
         'channel_description': '',
         'channel_emails': ''
     }
+    description = await asyncio.to_thread(fetch_description, channel_url)
+    if description is not None:
+        info['channel_description'] = description.strip()
+        info['channel_emails'] = ';'.join(extract_emails(info['channel_description']))
+        return info
     try:
-        page.goto(channel_url, timeout=25000)
-        page.wait_for_load_state('networkidle', timeout=10000)
-        dismiss_youtube_consent(page)
-        _expand_truncated_description(page)
+        await page.goto(channel_url, timeout=25000, wait_until='domcontentloaded')
+        # wait for the description preview itself rather than networkidle, which YouTube's
+        # long-poll connections keep from settling
+        try:
+            await page.wait_for_selector('yt-description-preview-view-model', timeout=8000)
+        except Exception:
+            pass
+        await _expand_truncated_description(page)
         
         # Extract description
-        desc_element = page.query_selector('tp-yt-paper-dialog yt-attributed-string#description-container span.yt-core-attributed-string')
-        if desc_element:
-            info['channel_description'] = desc_element.text_content().strip()
+        description = await page.evaluate(POPUP_DESCRIPTION_JS)
+        if description is not None:
+            info['channel_description'] = description.strip()
             # Extract emails from description
             emails = extract_emails(info['channel_description'])
             info['channel_emails'] = ';'.join(emails)
         
         # Close popup
-        page.keyboard.press('Escape')
-        page.wait_for_timeout(300)
+        await page.keyboard.press('Escape')
+        await page.wait_for_timeout(300)
     except Exception:
         pass
     return info
 
 
+async def run(args):
+    with open(args.input, 'r', encoding='utf-8') as infile:
+        lines = infile.readlines()
+    # Skip comment lines starting with #
+    data_lines = [line for line in lines if not line.strip().startswith('#')]
+    from io import StringIO
+    data_io = StringIO(''.join(data_lines))
+    reader = csv.DictReader(data_io)
+    rows = list(reader)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=not args.no_headless)
+
+        # Consent is dismissed once and the resulting state is saved to --state-file; later runs
+        # start every worker context from that file and skip the dismissal entirely
+        if os.path.exists(args.state_file):
+            state = args.state_file
+        else:
+            first_context = await browser.new_context(user_agent=USER_AGENT)
+            await first_context.route('**/*', block_heavy_resources)
+            page = await first_context.new_page()
+            try:
+                await page.goto('https://www.youtube.com', timeout=25000, wait_until='domcontentloaded')
+                await dismiss_youtube_consent(page)
+            except Exception:
+                pass
+            await page.close()
+            os.makedirs(os.path.dirname(args.state_file) or '.', exist_ok=True)
+            state = await first_context.storage_state(path=args.state_file)
+            await first_context.close()
+        contexts = [
+            await browser.new_context(user_agent=USER_AGENT, storage_state=state)
+            for _ in range(max(1, args.workers))
+        ]
+        for context in contexts:
+            await context.route('**/*', block_heavy_resources)
+
+        queue = asyncio.Queue()
+        for item in enumerate(rows):
+            queue.put_nowait(item)
+
+        with open(args.output, 'w', newline='', encoding='utf-8') as outfile:
+            writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames + ['channel_description', 'channel_emails'])
+            writer.writeheader()
+            # finished rows wait here until every earlier row is written, keeping input order
+            finished = {}
+            next_index = 0
+
+            async def worker(context):
+                nonlocal next_index
+                page = await context.new_page()
+                try:
+                    while not queue.empty():
+                        index, row = queue.get_nowait()
+                        # every row is written even if its lookup blows up, or the rows buffered
+                        # behind it in `finished` would never be flushed
+                        try:
+                            channel_info = await extract_description(row['channel_url'], page)
+                        except Exception:
+                            channel_info = {'channel_description': '', 'channel_emails': ''}
+                        row.update(channel_info)
+                        finished[index] = row
+                        while next_index in finished:
+                            writer.writerow(finished.pop(next_index))
+                            next_index += 1
+                finally:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+
+            await asyncio.gather(*(worker(context) for context in contexts))
+
+        for context in contexts:
+            await context.close()
+        await browser.close()
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--input', required=True, help='Input CSV file')
     parser.add_argument('--output', required=False, default='outputs/channels_with_descriptions.csv', help='Output CSV file')
     parser.add_argument('--no-headless', action='store_true', help='Run in non-headless mode')
+    parser.add_argument('--state-file', default=DEFAULT_STATE_FILE, help='Saved browser state (consent cookies); delete it to redo the consent step')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Channels processed in parallel (one browser context each)')
     args = parser.parse_args()
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=not args.no_headless)
-        context = browser.new_context(user_agent=USER_AGENT)
-        page = context.new_page()
-
-        with open(args.input, 'r', encoding='utf-8') as infile, open(args.output, 'w', newline='', encoding='utf-8') as outfile:
-            lines = infile.readlines()
-            # Skip comment lines starting with #
-            data_lines = [line for line in lines if not line.strip().startswith('#')]
-            from io import StringIO
-            data_io = StringIO(''.join(data_lines))
-            reader = csv.DictReader(data_io)
-            writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames + ['channel_description', 'channel_emails'])
-            writer.writeheader()
-
-            for row in reader:
-                channel_url = row['channel_url']
-                channel_info = extract_description(channel_url, page)
-                row.update(channel_info)
-                writer.writerow(row)
-
-        context.close()
-        browser.close()
+    asyncio.run(run(args))
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
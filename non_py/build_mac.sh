@@ -39,7 +39,7 @@ pip install --upgrade pip setuptools wheel
 
 echo "==> Installing minimal runtime dependencies into the venv"
 # Keep this minimal to avoid failures caused by a large repo-wide requirements.txt
-pip install pyinstaller streamlit playwright requests
+pip install pyinstaller streamlit playwright requests beautifulsoup4 lxml
 
 if [ "$BUNDLE_PLAYWRIGHT" -eq 1 ]; then
   echo "==> Installing Playwright browsers into the venv (chromium)"
@@ -18,6 +18,7 @@ import re
 import urllib.parse
 import requests
 import argparse
+import json
 import os
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
@@ -43,6 +44,75 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+# Steam app names looked up by get_game_name, kept across runs
+APPNAME_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "bbest", "appnames.json")
+# Email pattern compiled once; the bounded quantifiers (RFC local/domain/label limits) keep the
+# worst case linear on long junk strings, and scanned texts are capped at MAX_EMAIL_SCAN chars
+EMAIL_RE = re.compile(r"[A-Za-z0-9_.+\-]{1,64}@[A-Za-z0-9\-]{1,255}(?:\.[A-Za-z0-9\-]{1,24}){1,4}")
+MAX_EMAIL_SCAN = 100_000
+# about_me cleanup (FOLLOWERS / REVIEWS stats Steam renders after the text) and the reviews badge.
+# The stats are removed up to the end of their line; no leading \n?\s* (the whitespace pass below
+# collapses what's left) so a failed attempt doesn't rescan the whitespace run before every digit
+ABOUT_FOLLOWERS_RE = re.compile(r"[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b[^\n]*", re.I)
+ABOUT_REVIEWS_RE = re.compile(r"[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b[^\n]*", re.I)
+ABOUT_POSTED_RE = re.compile(r"\bPOSTED\b", re.I)
+WHITESPACE_RE = re.compile(r"\s+")
+# Reviews badge count, matched inside the page so only the number crosses the driver connection
+# (not the whole body text); a cheap substring test skips the regex on pages without the label
+REVIEWS_COUNT_JS = """() => {
+  const text = document.body ? document.body.innerText : '';
+  const upper = text.toUpperCase();
+  if (!upper.includes('REVIEWS') && !upper.includes('POSTED')) return null;
+  const m = /([\\d,]+)\\s*(?:REVIEWS|REVIEWS POSTED|POSTED)/i.exec(text);
+  return m ? m[1] : null;
+}"""
+# Requests aborted on the pooled and listing pages: only text is scraped. Stylesheets are kept
+# because inner_text depends on CSS visibility
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+# Anchor scans run inside the page: one round-trip returns the first link mentioning the appid
+# (resolved against the page URL) or whether any link does, instead of get_attribute per anchor
+FIRST_APPID_LINK_JS = """(links, appid) => {
+  const a = links.find(l => l.getAttribute('href').includes(appid));
+  return a ? a.href : null;
+}"""
+HAS_APPID_LINK_JS = "(links, appid) => links.some(l => l.getAttribute('href').includes(appid))"
+# Name, profile link and followers of a listing block in one evaluate (textContent, as before)
+CURATOR_BASIC_JS = """b => {
+  const name = b.querySelector('div.name span');
+  const profile = b.querySelector('a.profile_avatar');
+  const followers = b.querySelector('div.followers span');
+  return {
+    name: name ? (name.textContent || '').trim() : 'N/A',
+    profileLink: profile ? profile.getAttribute('href') || '' : '',
+    followers: followers ? (followers.textContent || '').trim() : 'N/A',
+  };
+}"""
+
+
+async def block_heavy_resources(route):
+    """Route handler: abort images/media/fonts and analytics requests, continue everything else."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def clean_about(about_me: str) -> str:
+    """Strip the FOLLOWERS / REVIEWS / POSTED stats from about_me and collapse whitespace.
+
+    Most about texts carry none of the labels, so each regex only runs when a plain substring
+    test says it can match.
+    """
+    upper = about_me.upper()
+    if "FOLLOWERS" in upper:
+        about_me = ABOUT_FOLLOWERS_RE.sub("", about_me)
+    if "POSTED" in upper:
+        about_me = ABOUT_POSTED_RE.sub("", ABOUT_REVIEWS_RE.sub("", about_me))
+    elif "REVIEWS" in upper:
+        about_me = ABOUT_REVIEWS_RE.sub("", about_me)
+    return WHITESPACE_RE.sub(" ", about_me).strip()
 
 
 async def extract_email_from_text(text: str):
@@ -52,7 +122,7 @@ async def extract_email_from_text(text: str):
     """
     if not text:
         return ""
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_RE.search(text[:MAX_EMAIL_SCAN])
     return match.group(0) if match else ""
 
 
@@ -68,7 +138,7 @@ async def extract_email_from_link(elem):
     email = ""
 
     # Try to extract email from the visible text
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_RE.search(text[:MAX_EMAIL_SCAN])
     if match:
         email = match.group(0)
     else:
@@ -84,7 +154,7 @@ async def extract_email_from_link(elem):
             # from being mistaken for an email address.
             url_like = decoded.lower().startswith("http://") or decoded.lower().startswith("https://")
             # Search for a proper email pattern anywhere in the decoded href/text
-            match2 = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", decoded)
+            match2 = EMAIL_RE.search(decoded[:MAX_EMAIL_SCAN])
             if match2:
                 email = match2.group(0)
             else:
@@ -107,16 +177,11 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
     about_me = ""
     sample_review = ""
     reviews_count = 0
+    appid_str = str(appid) if appid else ""  # appid links are matched as a plain substring
     try:
         # Basic info (from the listing block)
-        name_elem = await curator.query_selector("div.name span")
-        name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-
-        profile_elem = await curator.query_selector("a.profile_avatar")
-        profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-
-        follower_elem = await curator.query_selector("div.followers span")
-        followers = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
+        basic = await curator.evaluate(CURATOR_BASIC_JS)
+        name, profile_link, followers = basic["name"], basic["profileLink"], basic["followers"]
 
         # NOTE: we intentionally drop the per-listing 'recommendation' value (not useful)
 
@@ -174,15 +239,8 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
                     # Look for anchors on the profile page linking to the store/review for this appid
                     candidate_review_href = None
                     try:
-                        anchors = await page2.query_selector_all('a')
-                        for a in anchors:
-                            ahref = await a.get_attribute('href') or ''
-                            if not ahref:
-                                continue
-                            # Normalize and detect appid mentions in href (common patterns)
-                            if appid and (f"/app/{appid}" in ahref or f"app={appid}" in ahref or re.search(rf"{re.escape(str(appid))}", ahref)):
-                                candidate_review_href = urllib.parse.urljoin(page2.url, ahref)
-                                break
+                        if appid_str:
+                            candidate_review_href = await page2.eval_on_selector_all('a[href]', FIRST_APPID_LINK_JS, appid_str)
                     except Exception:
                         candidate_review_href = None
 
@@ -223,13 +281,7 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
                                         # ignore Steam's generic no-results text
                                         if "no more reviews" in (txt or "").lower():
                                             continue
-                                        anchors = await rev_el.query_selector_all('a')
-                                        matched = False
-                                        for a in anchors:
-                                            ahref = await a.get_attribute('href') or ''
-                                            if ahref and appid and re.search(rf"{re.escape(str(appid))}", ahref):
-                                                matched = True
-                                                break
+                                        matched = bool(appid_str) and await rev_el.eval_on_selector_all('a[href]', HAS_APPID_LINK_JS, appid_str)
                                         if not matched and app_name and app_name.lower() in (txt or "").lower():
                                             matched = True
                                         if matched:
@@ -316,20 +368,16 @@ async def process_curator(curator, page_pool, appid=None, app_name=None, listing
                             # Remove 'followers' and 'reviews posted' from 'about_me'
                             if about_me:
                                 # Clean the 'about_me' field to remove unwanted text
-                                about_me = re.sub(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", "", about_me, flags=re.I)
-                                about_me = re.sub(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", "", about_me, flags=re.I)
-                                about_me = re.sub(r"\bPOSTED\b", "", about_me, flags=re.I)
-                                about_me = re.sub(r"\s+", " ", about_me).strip()
+                                about_me = clean_about(about_me)
                                 print(f"[DEBUG] Cleaned 'about_me': {about_me}")
 
                 # If we still don't have a reviews_count, try scanning the page body for a reviews badge
                 if not reviews_count:
                     try:
-                        body_text = (await page2.inner_text('body') or "").strip()
-                        m2 = re.search(r"([\d,]+)\s*(?:REVIEWS|REVIEWS POSTED|POSTED)", body_text, flags=re.I)
-                        if m2:
+                        count_text = await page2.evaluate(REVIEWS_COUNT_JS)
+                        if count_text:
                             try:
-                                reviews_count = int(m2.group(1).replace(",", ""))
+                                reviews_count = int(count_text.replace(",", ""))
                                 print(f"[DEBUG] Extracted 'reviews_count': {reviews_count}")
                             except Exception as e:
                                 print(f"[DEBUG] Failed to parse 'reviews_count': {e}")
@@ -470,13 +518,29 @@ async def main():
     # Track which keys were newly discovered during this run so we can optionally export only new ones
     newly_added_keys = set()
 
+    try:
+        with open(APPNAME_CACHE_FILE, encoding="utf-8") as fh:
+            name_cache = json.load(fh)
+    except Exception:
+        name_cache = {}
+
     def get_game_name(appid: str) -> str:
-        """Sync helper: ask Steam API for friendly name, fallback to id."""
+        """Sync helper: ask Steam API for friendly name (cached on disk per appid), fallback to id."""
+        if str(appid) in name_cache:
+            return name_cache[str(appid)]
         try:
             url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
             resp = requests.get(url, timeout=5).json()
             if resp and str(appid) in resp and resp[str(appid)].get("success"):
-                return resp[str(appid)]["data"].get("name", f"Unknown ({appid})")
+                name = resp[str(appid)]["data"].get("name", f"Unknown ({appid})")
+                name_cache[str(appid)] = name
+                try:
+                    os.makedirs(os.path.dirname(APPNAME_CACHE_FILE), exist_ok=True)
+                    with open(APPNAME_CACHE_FILE, "w", encoding="utf-8") as fh:
+                        json.dump(name_cache, fh, ensure_ascii=False, indent=2)
+                except Exception as e:
+                    print(f"Could not save game name cache: {e}")
+                return name
         except Exception:
             pass
         return f"Unknown ({appid})"
@@ -501,6 +565,7 @@ async def main():
         page_pool = asyncio.Queue()
         for _ in range(MAX_CONCURRENT):
             ppage = await browser.new_page()
+            await ppage.route("**/*", block_heavy_resources)
             try:
                 await ppage.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
             except Exception:
@@ -528,6 +593,7 @@ async def main():
             # Start with the followers value extracted from the listing (if provided)
             followers = followers or "N/A"
             reviews_count = 0
+            appid_str = str(appid) if appid else ""  # appid links are matched as a plain substring
 
             if not profile_link:
                 return {
@@ -567,7 +633,7 @@ async def main():
                 try:
                     follower_elem = await page2.query_selector("div.followers span")
                     if follower_elem:
-                        followers = (await follower_elem.inner_text()).strip() or 'N/A'
+                        followers = (await follower_elem.text_content() or "").strip() or 'N/A'
                 except Exception:
                     pass
 
@@ -597,14 +663,8 @@ async def main():
 
                     candidate_review_href = None
                     try:
-                        anchors = await page2.query_selector_all('a')
-                        for a in anchors:
-                            ahref = await a.get_attribute('href') or ''
-                            if not ahref:
-                                continue
-                            if appid and (f"/app/{appid}" in ahref or f"app={appid}" in ahref or re.search(rf"{re.escape(str(appid))}", ahref)):
-                                candidate_review_href = urllib.parse.urljoin(page2.url, ahref)
-                                break
+                        if appid_str:
+                            candidate_review_href = await page2.eval_on_selector_all('a[href]', FIRST_APPID_LINK_JS, appid_str)
                     except Exception:
                         candidate_review_href = None
 
@@ -636,13 +696,7 @@ async def main():
                                         txt = (await rev_el.inner_text()).strip()
                                         if "no more reviews" in (txt or "").lower():
                                             continue
-                                        anchors = await rev_el.query_selector_all('a')
-                                        matched = False
-                                        for a in anchors:
-                                            ahref = await a.get_attribute('href') or ''
-                                            if ahref and appid and re.search(rf"{re.escape(str(appid))}", ahref):
-                                                matched = True
-                                                break
+                                        matched = bool(appid_str) and await rev_el.eval_on_selector_all('a[href]', HAS_APPID_LINK_JS, appid_str)
                                         if not matched and app_name and app_name.lower() in (txt or "").lower():
                                             matched = True
                                         if matched:
@@ -704,11 +758,10 @@ async def main():
                 try:
                     if not reviews_count:
                         try:
-                            body_text = (await page2.inner_text('body') or "").strip()
-                            m2 = re.search(r"([\d,]+)\s*(?:REVIEWS|REVIEWS POSTED|POSTED)", body_text, flags=re.I)
-                            if m2:
+                            count_text = await page2.evaluate(REVIEWS_COUNT_JS)
+                            if count_text:
                                 try:
-                                    reviews_count = int(m2.group(1).replace(",", ""))
+                                    reviews_count = int(count_text.replace(",", ""))
                                     print(f"[DEBUG] Extracted 'reviews_count': {reviews_count}")
                                 except Exception as e:
                                     print(f"[DEBUG] Failed to parse 'reviews_count': {e}")
@@ -751,11 +804,12 @@ async def main():
         # aggregated variable may already contain preloaded entries
 
         for appid in GAME_IDS:
-            app_name = get_game_name(appid)
+            app_name = await asyncio.to_thread(get_game_name, appid)
             curator_page_url = f"https://store.steampowered.com/curators/curatorsreviewing/?appid={appid}"
 
             # open listing page for this app id
             page = await browser.new_page()
+            await page.route("**/*", block_heavy_resources)
             try:
                 await page.set_default_navigation_timeout(NAV_TIMEOUT_MS)
             except Exception:
@@ -809,13 +863,10 @@ async def main():
             tasks = []
             keys = []
             for curator in curator_divs:
-                name_elem = await curator.query_selector("div.name span")
-                name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-                profile_elem = await curator.query_selector("a.profile_avatar")
-                profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
+                basic = await curator.evaluate(CURATOR_BASIC_JS)
+                name, profile_link = basic["name"], basic["profileLink"]
                 # Extract follower count from the listing block (preserve this value)
-                follower_elem = await curator.query_selector("div.followers span")
-                follower_text = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
+                follower_text = basic["followers"]
                 key = profile_link if profile_link else name
                 if key in aggregated:
                     aggregated[key]["games"].add(app_name)
@@ -885,59 +936,57 @@ async def main():
             ppage = await page_pool.get()
             await ppage.close()
 
-        # Flatten aggregated results and write CSV with a 'game' column
-        final_rows = []
-        for key, entry in aggregated.items():
-            row = entry["data"].copy()
-            games_field = ";".join(sorted(entry["games"]))
-            row["game"] = games_field
-
-            # Ensure we have a numeric reviews value (may have been populated by worker)
-            try:
-                row["reviews"] = int(row.get("reviews") or 0)
-            except Exception:
-                row["reviews"] = 0
-
-            # Validate that the email field contains a proper email pattern; clear it otherwise
-            email_val = (row.get("email") or "").strip()
-            if email_val and re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", email_val):
-                row["has_email"] = 1
-                row["email"] = email_val
-            else:
-                row["has_email"] = 0
-                row["email"] = ""
-
-            # Initialize 'about_me' with a default value to avoid scope issues
-            about_me = row.get("about_me", "[ERROR: Unable to extract 'about me' section]")
-            if not about_me:
-                about_me = "[ERROR: Unable to extract 'about me' section]"
-            print(f"[DEBUG] Final 'about_me' before saving: {about_me}")
-
-            # Apply cleaning logic to 'about_me' before saving
-            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", "", about_me, flags=re.I)
-            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", "", about_me, flags=re.I)
-            about_me = re.sub(r"\bPOSTED\b", "", about_me, flags=re.I)
-            about_me = re.sub(r"\s+", " ", about_me).strip()
-            print(f"[DEBUG] Cleaned 'about_me' before saving: {about_me}")
-            row["about_me"] = about_me
-
-            final_rows.append(row)
-
         # If user requested only newly discovered curators and an input CSV was provided,
-        # filter the rows accordingly.
-        rows_to_write = final_rows
+        # skip the other keys before doing any per-row work.
         if getattr(args, 'export_new_only', False) and args.input_csv:
-            # determine which rows correspond to newly_added_keys
-            rows_to_write = [r for k, r in zip(aggregated.keys(), final_rows) if k in newly_added_keys]
+            keys_to_write = [k for k in aggregated if k in newly_added_keys]
+        else:
+            keys_to_write = list(aggregated)
+
+        def flatten_rows():
+            """Yield one CSV tuple (with a 'game' column) per curator, reading entry["data"] without copying it."""
+            for key in keys_to_write:
+                entry = aggregated[key]
+                data = entry["data"]
+                games_field = ";".join(sorted(entry["games"]))
 
-        # Save CSV (include reviews, game and has_email columns)
+                # Ensure we have a numeric reviews value (may have been populated by worker)
+                try:
+                    reviews = int(data.get("reviews") or 0)
+                except Exception:
+                    reviews = 0
+
+                # Validate that the email field contains a proper email pattern; clear it otherwise
+                email_val = (data.get("email") or "").strip()
+                if email_val and EMAIL_RE.search(email_val):
+                    has_email = 1
+                else:
+                    has_email = 0
+                    email_val = ""
+
+                # Initialize 'about_me' with a default value to avoid scope issues
+                about_me = data.get("about_me", "[ERROR: Unable to extract 'about me' section]")
+                if not about_me:
+                    about_me = "[ERROR: Unable to extract 'about me' section]"
+                print(f"[DEBUG] Final 'about_me' before saving: {about_me}")
+
+                # Apply cleaning logic to 'about_me' before saving
+                about_me = clean_about(about_me)
+                print(f"[DEBUG] Cleaned 'about_me' before saving: {about_me}")
+
+                yield (
+                    data.get("curator_name", ""), data.get("steam_profile", ""), data.get("followers", ""), reviews,
+                    data.get("external_site", ""), about_me, data.get("sample_review", ""), email_val, has_email, games_field,
+                )
+
+        # Save CSV (include reviews, game and has_email columns); rows are streamed from the generator
         with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
             fieldnames = ["curator_name", "steam_profile", "followers", "reviews", "external_site", "about_me", "sample_review", "email", "has_email", "game"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows_to_write)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(flatten_rows())
 
-        print(f"💾 Saved {len(rows_to_write)} unique curators to {OUTPUT_FILE}")
+        print(f"💾 Saved {len(keys_to_write)} unique curators to {OUTPUT_FILE}")
         await browser.close()
 
 
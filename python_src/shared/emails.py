@@ -0,0 +1,26 @@
+import re
+import urllib.parse
+
+# google-re2 is optional: when installed, emails are matched by its linear-time automaton
+# (same compile/search/finditer/fullmatch API); otherwise fall back to the stdlib engine
+try:
+    import re2 as _email_regex
+except ImportError:
+    _email_regex = re
+
+# One email pattern for the Steam and YouTube scripts, compiled once
+EMAIL_PATTERN = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
+EMAIL_RE = _email_regex.compile(EMAIL_PATTERN)
+
+
+def find_email(text):
+    """Return the first email address in text or in a (URL-encoded) link href, or None."""
+    if not text:
+        return None
+    # mailto:/linkfilter URLs often carry the address percent-encoded (%40, %3A, ...)
+    if '%' in text:
+        text = urllib.parse.unquote(text)
+    if '@' not in text:
+        return None
+    m = EMAIL_RE.search(text)
+    return m.group(0) if m else None
@@ -15,10 +15,20 @@ Notes:
 """
 
 import streamlit as st
+import atexit
+import codecs
+import hashlib
+import queue
+import re
+import selectors
+import threading
 import tempfile
 import subprocess
+import shutil
+import signal
 import time
 import os
+import sys
 from pathlib import Path
 from collections import deque
 import uuid
@@ -28,7 +38,6 @@ st.set_page_config(page_title="Steam Curator Scraper UI", layout="centered")
 try:
     from python_src.shared import paths as shared_paths
 except Exception:
-    import sys, os
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     if repo_root not in sys.path:
         sys.path.insert(0, repo_root)
@@ -36,6 +45,245 @@ except Exception:
 
 OUT_DIR = shared_paths.OUTPUT_DIR
 
+# A Steam app id as typed into the form: digits only
+APPID_RE = re.compile(r"^\d{1,8}$")
+
+# Environment for scraper subprocesses: unbuffered UTF-8 stdout so log lines arrive as printed
+CHILD_ENV = {**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"}
+
+# Default worker count: half the cores (Playwright's own guidance), capped at the old max of 6
+_CPU = os.cpu_count() or 2
+DEFAULT_CONCURRENCY = min(_CPU // 2 or 1, 6)
+MAX_CONCURRENCY = max(_CPU, 6)
+
+# Minimum seconds between re-renders of a live log placeholder. Chatty scrapers print
+# hundreds of lines per second; re-rendering on every line swamps the websocket.
+LOG_FLUSH_INTERVAL = 0.1
+# Only the most recent lines are rendered; the full buffer is still kept and returned
+LOG_TAIL_LINES = 80
+# Bytes requested per read of a subprocess pipe
+READ_CHUNK_SIZE = 65536
+# How long a single wait for subprocess output may block before the UI loop gets control back
+LOG_POLL_INTERVAL = 0.1
+# Seconds a stopped subprocess gets to exit after SIGTERM before it is killed
+TERMINATE_GRACE = 5
+# After this many seconds without output the progress line says the process is still alive
+IDLE_NOTICE_AFTER = 10
+
+
+def start_process(cmd, env=CHILD_ENV):
+    """Launch `cmd` with stdout+stderr on one binary pipe, in its own process group on POSIX.
+
+    The separate session lets stop_process() take down Playwright's browser children too.
+    """
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env,
+        start_new_session=(os.name == "posix"),
+    )
+
+
+def stop_process(proc, grace=TERMINATE_GRACE):
+    """Terminate `proc` (and its process group on POSIX) if still running: SIGTERM, then SIGKILL."""
+    if proc.poll() is not None:
+        return
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        try:
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+    else:
+        proc.terminate()
+        try:
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def iter_output_chunks(proc, timeout=LOG_POLL_INTERVAL):
+    """Yield raw stdout chunks from `proc`, or None when nothing arrived within `timeout`.
+
+    On POSIX the pipe is polled with a selector; on Windows, where select() only works on
+    sockets, a daemon reader thread feeds a queue instead. Stops at EOF (or, on POSIX, once
+    the process has exited and its pipe has nothing left to read).
+    """
+    if os.name == "posix":
+        with selectors.DefaultSelector() as sel:
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            while True:
+                if sel.select(timeout):
+                    chunk = proc.stdout.read1(READ_CHUNK_SIZE)
+                    if not chunk:
+                        return
+                    yield chunk
+                elif proc.poll() is not None:
+                    return
+                else:
+                    yield None
+    else:
+        chunks = queue.Queue()
+
+        def reader():
+            for chunk in iter(lambda: proc.stdout.read1(READ_CHUNK_SIZE), b""):
+                chunks.put(chunk)
+            chunks.put(b"")
+
+        threading.Thread(target=reader, daemon=True).start()
+        while True:
+            try:
+                chunk = chunks.get(timeout=timeout)
+            except queue.Empty:
+                yield None
+                continue
+            if not chunk:
+                return
+            yield chunk
+
+
+def stream_process_logs(proc, log_box, progress_box=None, max_lines=2000):
+    """Read a subprocess' stdout into a bounded buffer and mirror it to `log_box`.
+
+    `proc` must be opened with a binary stdout pipe; output is read in chunks and
+    decoded/split into lines here.
+
+    Every line is kept (up to `max_lines`), but only the last LOG_TAIL_LINES are shown and
+    the placeholder is only re-rendered at most every LOG_FLUSH_INTERVAL seconds, plus one
+    final flush once the process exits.
+    Returns the buffered lines.
+    """
+    log_lines = deque(maxlen=max_lines)
+    # separate bounded window for rendering, so flushes never walk the full buffer
+    visible = deque(maxlen=LOG_TAIL_LINES)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    last_flush = time.monotonic()
+    pending = False
+
+    def flush():
+        # st.code renders preformatted text directly, skipping the markdown parser
+        log_box.code("\n".join(visible), language=None)
+        if progress_box is not None:
+            progress_box.text(log_lines[-1] if log_lines else "")
+
+    last_output = time.monotonic()
+    # chunks come from read1, i.e. whatever the pipe currently holds, not a single line
+    for chunk in iter_output_chunks(proc):
+        now = time.monotonic()
+        if chunk is None:
+            # nothing to read: flush anything still pending and show the process is alive
+            idle = now - last_output
+            if progress_box is not None and not pending and idle >= IDLE_NOTICE_AFTER:
+                progress_box.text(f"Still running… no output for {int(idle)}s")
+        else:
+            last_output = now
+            lines = (tail + decoder.decode(chunk)).split("\n")
+            # the last element is an incomplete line (or "") — keep it for the next chunk
+            tail = lines.pop()
+            if lines:
+                lines = [line.rstrip("\r") for line in lines]
+                log_lines.extend(lines)
+                visible.extend(lines)
+                pending = True
+        if pending and now - last_flush >= LOG_FLUSH_INTERVAL:
+            flush()
+            pending = False
+            last_flush = now
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        log_lines.append(tail.rstrip("\r"))
+        visible.append(log_lines[-1])
+        pending = True
+    if pending:
+        flush()
+    proc.wait()
+    return log_lines
+
+
+# Uploads are written once per distinct file content and reused across reruns
+UPLOAD_DIR = Path(tempfile.gettempdir()) / "steam_scraper_uploads"
+
+
+@st.cache_data(show_spinner=False)
+def _persist_upload(name: str, digest: str, _upload) -> str:
+    """Copy an upload to a content-addressed temp path and return that path.
+
+    Cached on `digest` (the leading underscore keeps Streamlit from hashing the file
+    object itself), so submitting the same file again skips the write. The copy is
+    streamed in 1 MiB chunks rather than materialised as one bytes object.
+    """
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    path = UPLOAD_DIR / f"uploaded_{digest}_{Path(name).name}"
+    if not path.exists():
+        _upload.seek(0)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(_upload, f, length=1 << 20)
+    return str(path)
+
+
+def persist_upload(upload):
+    """Return a local Path holding the contents of a Streamlit UploadedFile."""
+    # getbuffer() is a view over the upload, so hashing it does not copy the bytes
+    digest = hashlib.blake2b(upload.getbuffer(), digest_size=8).hexdigest()
+    path = _persist_upload(upload.name, digest, upload)
+    if not os.path.exists(path):
+        # the temp dir was cleaned up behind the cache's back; write it again
+        _persist_upload.clear()
+        path = _persist_upload(upload.name, digest, upload)
+    return Path(path)
+
+
+def session_tmpdir(prefix):
+    """Return this browser session's working directory for `prefix`, creating it once.
+
+    Reruns reuse the same directory instead of leaving a fresh mkdtemp behind on every
+    submission; it is removed when the Streamlit server exits.
+    """
+    key = f"tmpdir_{prefix}"
+    if key not in st.session_state:
+        path = Path(tempfile.mkdtemp(prefix=prefix))
+        atexit.register(shutil.rmtree, path, ignore_errors=True)
+        st.session_state[key] = path
+    path = st.session_state[key]
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def run_cache_key(cmd, *paths):
+    """Hash a command line plus the contents of the files it reads into a short key."""
+    h = hashlib.blake2b(repr(cmd).encode("utf-8"), digest_size=8)
+    for path in paths:
+        if not path:
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+# Bounded: each entry holds a whole output file in memory
+@st.cache_data(show_spinner=False, max_entries=8, ttl=600)
+def _read_output(path: str, mtime: float) -> bytes:
+    """Read a generated file; cached on (path, mtime) so reruns don't re-read it."""
+    return Path(path).read_bytes()
+
+
+def read_output(path):
+    """Return the bytes of an output CSV for st.download_button."""
+    path = Path(path)
+    return _read_output(str(path), path.stat().st_mtime)
+
+
 # Global headless toggle
 if 'headless' not in st.session_state:
     st.session_state.headless = True
@@ -57,9 +305,10 @@ with st.form(key="scrape_form"):
     games_text = st.text_area("App IDs (one per line)", height=120, placeholder="1948280\n3112170")
     games_file = st.file_uploader("Or upload a games file (one appid per line)", type=["txt", "csv"])    
     scroll_until_end = st.checkbox("Scroll until end (collect full listings)", value=False)
-    concurrency = st.slider("Concurrency (profile page workers)", min_value=1, max_value=6, value=1)
+    concurrency = st.slider("Concurrency (profile page workers)", min_value=1, max_value=MAX_CONCURRENCY, value=DEFAULT_CONCURRENCY)
     output_filename = st.text_input("Fixed output filename (optional, e.g. merged.csv)", value=os.path.join(OUT_DIR, "merged.csv"))
     export_new_only = st.checkbox("Export only newly discovered curators (requires input CSV)", value=False)
+    force_rerun = st.checkbox("Re-run even if these exact inputs were already scraped this session", value=False)
     run_btn = st.form_submit_button("Run scraper")
 
 # Area to show logs
@@ -72,18 +321,15 @@ st.header("Fill missing About/Email — standalone")
 with st.form(key="standalone_filler_form"):
     filler_upload = st.file_uploader("CSV to fill (optional)", type=["csv"], key="filler_upload")
     filler_existing_path = st.text_input("Or existing CSV path (repo-relative)", value="dice.csv")
-    filler_concurrency = st.slider("Filler concurrency", min_value=1, max_value=6, value=1)
+    filler_concurrency = st.slider("Filler concurrency", min_value=1, max_value=MAX_CONCURRENCY, value=DEFAULT_CONCURRENCY)
     filler_no_headless = st.checkbox("Show browser while filling (no-headless)", value=False)
     run_filler_now = st.form_submit_button("Run filler now")
 
 if run_filler_now:
-    tmpdir_f = Path(tempfile.mkdtemp(prefix="steam_filler_"))
     input_csv_path = None
     # prefer uploaded file
     if filler_upload is not None:
-        input_csv_path = tmpdir_f / f"uploaded_input_{int(time.time())}.csv"
-        with open(input_csv_path, "wb") as f:
-            f.write(filler_upload.getbuffer())
+        input_csv_path = persist_upload(filler_upload)
     else:
         candidate_path = Path(filler_existing_path)
         if not candidate_path.is_absolute():
@@ -95,38 +341,24 @@ if run_filler_now:
 
     if input_csv_path:
         out_path = Path(str(input_csv_path).rsplit('.', 1)[0] + '_filled.csv')
-        cmd_fill = ["python", "-m", "python_src.steam.fill_about_missing", "--input", str(input_csv_path), "--output", str(out_path), "--concurrency", str(max(1, filler_concurrency))]
+        cmd_fill = [sys.executable, "-u", "-m", "python_src.steam.fill_about_missing", "--input", str(input_csv_path), "--output", str(out_path), "--concurrency", str(max(1, filler_concurrency))]
         if filler_no_headless or not st.session_state.headless:
             cmd_fill.append("--no-headless")
 
         st.info("Running filler: " + " ".join(cmd_fill))
         filler_log = st.empty()
         filler_progress = st.empty()
-        log_lines = []
-        proc = subprocess.Popen(cmd_fill, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        proc = start_process(cmd_fill)
         try:
-            while True:
-                line = proc.stdout.readline()
-                if line == '' and proc.poll() is not None:
-                    break
-                if line:
-                    for sub in line.splitlines():
-                        log_lines.append(sub)
-                        if len(log_lines) > 2000:
-                            log_lines = log_lines[-2000:]
-                    filler_log.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-                    filler_progress.text(log_lines[-1] if log_lines else "")
-            proc.wait()
+            stream_process_logs(proc, filler_log, filler_progress)
         except Exception as e:
             st.error(f"Error while running filler: {e}")
         finally:
-            if proc.poll() is None:
-                proc.terminate()
+            stop_process(proc)
 
         if out_path.exists():
             st.success(f"Filler finished — output: {out_path}")
-            with open(out_path, 'rb') as fh:
-                st.download_button('Download filled CSV', fh.read(), file_name=out_path.name, mime='text/csv')
+            st.download_button('Download filled CSV', read_output(out_path), file_name=out_path.name, mime='text/csv')
         else:
             st.warning('Filler did not produce an output file. Check logs above for details.')
 
@@ -140,12 +372,9 @@ with st.form(key="email_extractor_form"):
     run_email_extractor = st.form_submit_button("Run email extractor")
 
 if run_email_extractor:
-    tmpdir_e = Path(tempfile.mkdtemp(prefix="steam_email_"))
     input_csv_path = None
     if email_input_upload is not None:
-        input_csv_path = tmpdir_e / f"uploaded_input_{int(time.time())}.csv"
-        with open(input_csv_path, "wb") as f:
-            f.write(email_input_upload.getbuffer())
+        input_csv_path = persist_upload(email_input_upload)
     else:
         candidate_path = Path(email_existing_path)
         if not candidate_path.is_absolute():
@@ -161,34 +390,21 @@ if run_email_extractor:
         else:
             out_path = Path(str(input_csv_path).rsplit('.', 1)[0] + '_emails.csv')
 
-        cmd = ["python", "-m", "python_src.steam.extract_emails_from_about", "--input", str(input_csv_path), "--output", str(out_path)]
+        cmd = [sys.executable, "-u", "-m", "python_src.steam.extract_emails_from_about", "--input", str(input_csv_path), "--output", str(out_path)]
         st.info("Running extractor: " + " ".join(cmd))
 
         log_box = st.empty()
-        log_lines = []
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        proc = start_process(cmd)
         try:
-            while True:
-                line = proc.stdout.readline()
-                if line == '' and proc.poll() is not None:
-                    break
-                if line:
-                    for sub in line.splitlines():
-                        log_lines.append(sub)
-                        if len(log_lines) > 2000:
-                            log_lines = log_lines[-2000:]
-                    log_box.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-            proc.wait()
+            stream_process_logs(proc, log_box)
         except Exception as e:
             st.error(f"Error while running extractor: {e}")
         finally:
-            if proc.poll() is None:
-                proc.terminate()
+            stop_process(proc)
 
         if out_path.exists():
             st.success(f"Extractor finished — output: {out_path.name}")
-            with open(out_path, 'rb') as fh:
-                st.download_button('Download CSV with emails', fh.read(), file_name=out_path.name, mime='text/csv')
+            st.download_button('Download CSV with emails', read_output(out_path), file_name=out_path.name, mime='text/csv')
         else:
             st.warning('Extractor did not produce an output file. Check logs above for details.')
 
@@ -205,28 +421,25 @@ with st.form(key="steam_search_form"):
     run_search = st.form_submit_button("Run Steam search scraper")
 
 if run_search:
-    tmpdir_s = Path(tempfile.mkdtemp(prefix="steam_search_"))
+    tmpdir_s = session_tmpdir("steam_search_")
     st.info(f"Working directory: {tmpdir_s}")
     queries_path = None
     # prefer uploaded file
     if search_queries_file is not None:
-        queries_path = tmpdir_s / f"uploaded_queries_{int(time.time())}.txt"
-        with open(queries_path, "wb") as f:
-            f.write(search_queries_file.getbuffer())
+        queries_path = persist_upload(search_queries_file)
     else:
         # use text area
-        lines = [l.strip() for l in search_queries_text.splitlines() if l.strip()]
+        lines = list(dict.fromkeys(l for l in map(str.strip, search_queries_text.splitlines()) if l))
         if lines:
-            queries_path = tmpdir_s / f"queries_{int(time.time())}.txt"
+            queries_path = tmpdir_s / f"queries_{uuid.uuid4().hex[:8]}.txt"
             with open(queries_path, "w", encoding="utf-8") as f:
-                for l in lines:
-                    f.write(l + "\n")
+                f.write("\n".join(lines) + "\n")
     if not queries_path or not queries_path.exists():
         st.error("No queries provided. Paste queries or upload a queries file.")
     else:
         # prepare output path
         output_path = tmpdir_s / (search_output_name.strip() if search_output_name.strip() else "steam_games.csv")
-        cmd = ["python", "-m", "python_src.steam.steam_search_scrape", "--queries-file", str(queries_path), "--output", str(output_path), "--pages", str(int(search_pages))]
+        cmd = [sys.executable, "-u", "-m", "python_src.steam.steam_search_scrape", "--queries-file", str(queries_path), "--output", str(output_path), "--pages", str(int(search_pages))]
         if search_no_headless or not st.session_state.headless:
             cmd.append("--no-headless")
         if search_debug_dir and search_debug_dir.strip():
@@ -240,30 +453,19 @@ if run_search:
 
         st.write("Running:", " ".join(cmd))
         log_box = st.empty()
-        log_lines = []
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        # the session directory is reused: don't let a failed run offer the previous run's file
+        output_path.unlink(missing_ok=True)
+        proc = start_process(cmd)
         try:
-            while True:
-                line = proc.stdout.readline()
-                if line == '' and proc.poll() is not None:
-                    break
-                if line:
-                    for sub in line.splitlines():
-                        log_lines.append(sub)
-                        if len(log_lines) > 2000:
-                            log_lines = log_lines[-2000:]
-                    log_box.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-            proc.wait()
+            stream_process_logs(proc, log_box)
         except Exception as e:
             st.error(f"Error while running search scraper: {e}")
         finally:
-            if proc.poll() is None:
-                proc.terminate()
+            stop_process(proc)
 
-        if output_path.exists():
+        if proc.returncode == 0 and output_path.exists():
             st.success(f"Search finished — output: {output_path.name}")
-            with open(output_path, 'rb') as fh:
-                st.download_button('Download CSV', fh.read(), file_name=output_path.name, mime='text/csv')
+            st.download_button('Download CSV', read_output(output_path), file_name=output_path.name, mime='text/csv')
         else:
             st.warning('Search did not produce an output file. Check logs above for details.')
 
@@ -279,12 +481,12 @@ with st.form(key="steam_charts_form"):
     run_charts = st.form_submit_button("Run charts scraper")
 
 if run_charts:
-    tmpdir_c = Path(tempfile.mkdtemp(prefix="steam_charts_"))
+    tmpdir_c = session_tmpdir("steam_charts_")
     st.info(f"Working directory: {tmpdir_c}")
 
     # build command
     output_path = tmpdir_c / (charts_output_name.strip() if charts_output_name.strip() else "steam_charts.csv")
-    cmd = ["python", "-m", "python_src.steam.steam_search_scrape", "--charts", "--charts-count", str(int(charts_count)), "--output", str(output_path)]
+    cmd = [sys.executable, "-u", "-m", "python_src.steam.steam_search_scrape", "--charts", "--charts-count", str(int(charts_count)), "--output", str(output_path)]
     if charts_no_headless or not st.session_state.headless:
         cmd.append("--no-headless")
     # if user does not want slow detail visits, pass --no-details
@@ -300,30 +502,19 @@ if run_charts:
 
     st.write("Running:", " ".join(cmd))
     log_box = st.empty()
-    log_lines = []
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    # the session directory is reused: don't let a failed run offer the previous run's file
+    output_path.unlink(missing_ok=True)
+    proc = start_process(cmd)
     try:
-        while True:
-            line = proc.stdout.readline()
-            if line == '' and proc.poll() is not None:
-                break
-            if line:
-                for sub in line.splitlines():
-                    log_lines.append(sub)
-                    if len(log_lines) > 2000:
-                        log_lines = log_lines[-2000:]
-                log_box.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-        proc.wait()
+        stream_process_logs(proc, log_box)
     except Exception as e:
         st.error(f"Error while running charts scraper: {e}")
     finally:
-        if proc.poll() is None:
-            proc.terminate()
+        stop_process(proc)
 
-    if output_path.exists():
+    if proc.returncode == 0 and output_path.exists():
         st.success(f"Charts scraping finished — output: {output_path.name}")
-        with open(output_path, 'rb') as fh:
-            st.download_button('Download CSV', fh.read(), file_name=output_path.name, mime='text/csv')
+        st.download_button('Download CSV', read_output(output_path), file_name=output_path.name, mime='text/csv')
         st.balloons()
     else:
         st.warning('Charts scraper did not produce an output file. Check logs above for details.')
@@ -334,37 +525,37 @@ st.text("YouTube scrapers have been disabled in this UI. Run the YouTube scripts
 
 if run_btn:
     # prepare temp directory for inputs and outputs
-    tmpdir = Path(tempfile.mkdtemp(prefix="steam_scraper_"))
+    tmpdir = session_tmpdir("steam_scraper_")
     st.info(f"Working directory: {tmpdir}")
 
     input_csv_path = ""
     if input_csv is not None:
-        input_csv_path = tmpdir / f"uploaded_input_{int(time.time())}.csv"
-        with open(input_csv_path, "wb") as f:
-            f.write(input_csv.getbuffer())
-        input_csv_path = str(input_csv_path)
+        input_csv_path = str(persist_upload(input_csv))
 
     games_file_path = ""
     # prefer explicit upload, otherwise use text box
     if games_file is not None:
-        games_file_path = tmpdir / f"uploaded_games_{int(time.time())}.txt"
-        with open(games_file_path, "wb") as f:
-            f.write(games_file.getbuffer())
-        games_file_path = str(games_file_path)
+        games_file_path = str(persist_upload(games_file))
     elif games_text.strip():
-        games_file_path = tmpdir / f"games_{int(time.time())}.txt"
-        with open(games_file_path, "w", encoding="utf-8") as f:
-            for line in games_text.splitlines():
-                s = line.strip()
-                if s:
-                    f.write(s + "\n")
-        games_file_path = str(games_file_path)
+        # strip, drop blanks, reject non-numeric ids and de-duplicate (order preserved)
+        entries = [s for s in map(str.strip, games_text.splitlines()) if s]
+        bad = [s for s in entries if not APPID_RE.match(s)]
+        appids = list(dict.fromkeys(s for s in entries if APPID_RE.match(s)))
+        if bad:
+            st.warning(f"Ignored {len(bad)} invalid app id(s): {', '.join(bad[:5])}{' …' if len(bad) > 5 else ''}")
+        if appids:
+            games_file_path = tmpdir / f"games_{uuid.uuid4().hex[:8]}.txt"
+            with open(games_file_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(appids) + "\n")
+            games_file_path = str(games_file_path)
+        else:
+            st.error("None of the pasted lines is a numeric Steam app id.")
     else:
         st.error("No app ids provided. Paste app ids or upload a games file.")
 
     if games_file_path:
         # build command
-        cmd = ["python", "-m", "python_src.steam.bbest", "--games-file", games_file_path, "--concurrency", str(concurrency)]
+        cmd = [sys.executable, "-u", "-m", "python_src.steam.bbest", "--games-file", games_file_path, "--concurrency", str(concurrency)]
         if input_csv_path:
             cmd += ["--input-csv", input_csv_path]
 
@@ -376,14 +567,13 @@ if run_btn:
             cmd += ["--scroll-until-end"]
 
         # If user provided a fixed output filename, pass an absolute path in tmpdir so the app writes there
-        output_path = None
         if output_filename and output_filename.strip():
             output_path = tmpdir / output_filename.strip()
             cmd += ["--output-file", str(output_path)]
         else:
             # Always direct scraper output into our tmpdir so we don't accidentally pick up
             # old CSVs from the repo root (which may still contain a 'reviews' column).
-            output_path = tmpdir / f"curators_output_{int(time.time())}.csv"
+            output_path = tmpdir / f"curators_output_{uuid.uuid4().hex[:8]}.csv"
             cmd += ["--output-file", str(output_path)]
             st.info(f"Scraper will write output to temporary file: {output_path.name}")
         if export_new_only:
@@ -391,52 +581,45 @@ if run_btn:
         if not st.session_state.headless:
             cmd.append('--no-headless')
 
-        st.write("Running:", " ".join(cmd))
-
-        # run subprocess and stream logs
-        max_lines = 2000  # bounded buffer of lines to keep in the UI
-        log_lines = deque(maxlen=max_lines)
-        # Use a placeholder and render logs via a fenced code block (markdown) to avoid Streamlit API differences
-        log_area.markdown("```text\n\n```")
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        # Identical flags + identical file contents => identical scrape; reuse the earlier result.
+        # File paths are left out of the key (they carry random suffixes), their contents are hashed.
+        path_args = {games_file_path, input_csv_path, str(output_path)}
+        run_key = run_cache_key([a for a in cmd if a not in path_args], games_file_path, input_csv_path)
+        cached_result = tmpdir / f"result_{run_key}.csv"
 
-        try:
-            # Read line-by-line and update the UI incrementally
-            while True:
-                line = process.stdout.readline()
-                if line == '' and process.poll() is not None:
-                    break
-                if line:
-                    # store and display a bounded amount of recent log lines
-                    for subline in line.splitlines():
-                        log_lines.append(subline)
-                    # update the placeholder output using a fenced code block so long logs render nicely
-                    log_area.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-                    progress_text.text(log_lines[-1] if log_lines else "")
-            process.wait()
-        except Exception as e:
-            st.error(f"Error while running scraper: {e}")
-        finally:
-            if process.poll() is None:
-                process.terminate()
-
-        # Determine output CSV to offer for download
-        candidate = None
-        # If we passed an explicit output path, use that first
-        if output_path:
-            if output_path.exists():
-                candidate = output_path
-        # else look in the temp dir for curators_*.csv
-        if not candidate:
-            csv_candidates = list(tmpdir.glob("curators_*.csv"))
-            if csv_candidates:
-                candidate = max(csv_candidates, key=lambda p: p.stat().st_mtime)
+        if cached_result.exists() and not force_rerun:
+            st.success("Reusing the result of an identical earlier run in this session.")
+            shutil.copyfile(cached_result, output_path)
+            succeeded = True
+        else:
+            st.write("Running:", " ".join(cmd))
+
+            # the session directory is reused: don't let a failed run offer the previous run's file
+            output_path.unlink(missing_ok=True)
+            # run subprocess and stream logs
+            log_area.code("", language=None)
+            # PLAYWRIGHT_WORKERS lets bbest size its page pool even if --concurrency is dropped
+            env = {**CHILD_ENV, "PLAYWRIGHT_WORKERS": str(concurrency)}
+            process = start_process(cmd, env=env)
+
+            try:
+                # Buffer every line but only re-render the placeholder a few times per second
+                stream_process_logs(process, log_area, progress_text)
+            except Exception as e:
+                st.error(f"Error while running scraper: {e}")
+            finally:
+                stop_process(process)
+
+            succeeded = process.returncode == 0
+            if succeeded and output_path.exists():
+                shutil.copyfile(output_path, cached_result)
+
+        # Determine output CSV to offer for download (output_path is always passed via --output-file)
+        candidate = output_path if succeeded and output_path.exists() else None
 
         if candidate:
             st.success(f"Done — output: {candidate}")
-            with open(candidate, "rb") as f:
-                data = f.read()
-            st.download_button("Download CSV", data, file_name=candidate.name, mime="text/csv")
+            st.download_button("Download CSV", read_output(candidate), file_name=candidate.name, mime="text/csv")
 
             # New: Add a convenience button to run the filler on this CSV and produce a *_filled.csv
             st.markdown("---")
@@ -446,7 +629,7 @@ if run_btn:
 
             if run_filler:
                 filled_path = candidate.with_name(candidate.stem + '_filled.csv')
-                cmd_fill = ["python", "-m", "python_src.steam.fill_about_missing", "--input", str(candidate), "--output", str(filled_path), "--concurrency", str(max(1, concurrency))]
+                cmd_fill = [sys.executable, "-u", "-m", "python_src.steam.fill_about_missing", "--input", str(candidate), "--output", str(filled_path), "--concurrency", str(max(1, concurrency))]
                 if show_browser_for_filler or not st.session_state.headless:
                     cmd_fill.append("--no-headless")
 
@@ -454,31 +637,18 @@ if run_btn:
                 # small log area for the filler
                 filler_log = st.empty()
                 filler_progress = st.empty()
-                log_lines = []
-                proc = subprocess.Popen(cmd_fill, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+                filled_path.unlink(missing_ok=True)
+                proc = start_process(cmd_fill)
                 try:
-                    while True:
-                        line = proc.stdout.readline()
-                        if line == '' and proc.poll() is not None:
-                            break
-                        if line:
-                            for sub in line.splitlines():
-                                log_lines.append(sub)
-                                if len(log_lines) > 2000:
-                                    log_lines = log_lines[-2000:]
-                                filler_log.markdown("```text\n" + "\n".join(log_lines) + "\n```")
-                                filler_progress.text(log_lines[-1] if log_lines else "")
-                    proc.wait()
+                    stream_process_logs(proc, filler_log, filler_progress)
                 except Exception as e:
                     st.error(f"Error while running filler: {e}")
                 finally:
-                    if proc.poll() is None:
-                        proc.terminate()
+                    stop_process(proc)
 
-                if filled_path.exists():
+                if proc.returncode == 0 and filled_path.exists():
                     st.success(f"Filler finished — output: {filled_path.name}")
-                    with open(filled_path, 'rb') as fh:
-                        st.download_button('Download filled CSV', fh.read(), file_name=filled_path.name, mime='text/csv')
+                    st.download_button('Download filled CSV', read_output(filled_path), file_name=filled_path.name, mime='text/csv')
                 else:
                     st.warning('Filler did not produce an output file. Check logs above for details.')
         else:
@@ -9,7 +9,7 @@ Usage highlights:
 Example:
   python bbest.py --input-csv curators_prev.csv --games-file new_games.txt --scroll-until-end --concurrency 1 --output-file merged.csv --export-new-only
 
-Requirements: playwright, requests
+Requirements: playwright (curator listings only), requests, beautifulsoup4, lxml
 """
 
 import asyncio
@@ -17,20 +17,28 @@ import csv
 import re
 import urllib.parse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 import os
 import sys
 import builtins
 import json
 import time
+import operator
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 try:
     from python_src.shared import csv_helpers
     from python_src.shared import paths as shared_paths
+    from python_src.shared.emails import EMAIL_RE, find_email
 except Exception:
     import csv_helpers
     import paths as shared_paths
+    from emails import EMAIL_RE, find_email
 
 # Prevent BlockingIOError when many async tasks write to stdout: make stdout blocking
 try:
@@ -68,8 +76,11 @@ WAIT_BETWEEN_SCROLLS = 1.5
 # loading new curator entries (useful for games with many curators, e.g. ~1100)
 SCROLL_UNTIL_END = False
 # output filename is computed in main after normalization of GAME_IDS
-# Reduce the default MAX_CONCURRENT value to limit the number of pages opened simultaneously
-MAX_CONCURRENT = 1  # Adjusted to open only one page at a time
+# Curator profiles fetched in parallel (plain HTTP requests, no browser pages). One at a time
+# by default to keep the request rate to Steam low; raise it with --concurrency/$PLAYWRIGHT_WORKERS
+MAX_CONCURRENT = 1
+# Number of game listings scrolled at the same time (each holds one extra page open)
+LISTING_CONCURRENCY = 2
 
 # Navigation / retry tuning (adjust if Steam is slow or rate-limiting you)
 NAV_TIMEOUT_MS = 30000     # 30s navigation timeout
@@ -80,437 +91,568 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+# The scraper only reads text and links: skip downloading these (stylesheets are kept
+# because innerText depends on CSS visibility)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+def steam_adapter(pool_maxsize=32):
+    """HTTPS adapter for _STEAM_SESSION with pool_maxsize kept-alive connections per host."""
+    return HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=Retry(total=NAV_RETRIES, backoff_factor=0.5))
+
+
+# Shared HTTP session for Steam API calls and curator profile/About pages: keeps connections
+# to store.steampowered.com alive instead of a new TCP+TLS handshake per request. English pages
+# are requested explicitly since the FOLLOWERS/REVIEWS regexes match Steam's English labels.
+_STEAM_SESSION = requests.Session()
+_STEAM_SESSION.headers.update({"User-Agent": DEFAULT_USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+_STEAM_SESSION.mount("https://", steam_adapter())
+
+# Regexes used per curator, compiled once (EMAIL_RE is shared, see python_src/shared/emails.py)
+# about_me cleanup: strip the FOLLOWERS / REVIEWS stats block Steam renders after the text.
+# Applied in this order (see clean_about): each pass sees what the previous one left.
+ABOUT_FOLLOWERS_RE = re.compile(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", re.I)
+ABOUT_REVIEWS_RE = re.compile(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", re.I)
+ABOUT_POSTED_RE = re.compile(r"\bPOSTED\b", re.I)
+WHITESPACE_RE = re.compile(r"\s+")
+MULTISPACE_RE = re.compile(r"\s{2,}")
+FOLLOWERS_SPLIT_RE = re.compile(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b", re.I)
+PROFILE_STATS_RE = re.compile(r"FOLLOWERS|REVIEWS|POSTED", re.I)
+REVIEWS_COUNT_RE = re.compile(r"([\d,]+)\s*(?:REVIEWS|REVIEWS POSTED|POSTED)", re.I)
+UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+# Selectors tried (in order) for review text on a curator profile / review page
+REVIEW_PAGE_SELECTORS = [
+    "div.apphub_UserReviewCardContent", "div.review_box", "div.user_review",
+    "div.review_body", "div.review_text", "div.reviews p", "div.text"
+]
+# Selectors tried (in order) for the curator's About text
+ABOUT_TEXT_SELECTORS = [
+    "div.about_container div.desc p.tagline",
+    "div.about_container div.desc",
+    "div.desc p",
+    "div.desc",
+    "div.profile_about",
+    "div.curator_about",
+]
+# Fallback selectors for a review snippet inside a listing block
+LISTING_SNIPPET_SELECTORS = ["div.review_text", "div.curator_review", "div.recent_review", "div.review_body", "p.tagline", "div.review", "div.text"]
+
+# Listing DOM reads are batched into single evaluate calls: one round-trip per page instead
+# of one per element/attribute. Profile and About pages are server-rendered and fetched over
+# plain HTTP (see fetch_soup).
+LISTING_JS = """(blocks, {appid, snippetSelectors}) => {
+  // built once per listing, not per block/anchor
+  const text = el => (el && el.innerText || '').trim();
+  const usable = t => t && !t.toLowerCase().includes('no more reviews');
+  const appHref = '/app/' + appid;
+  const appParam = 'app=' + appid;
+  const snippetSelector = snippetSelectors.join(', ');
+  return blocks.map(b => {
+    const nameEl = b.querySelector('div.name span');
+    const profileEl = b.querySelector('a.profile_avatar');
+    const followersEl = b.querySelector('div.followers span');
+    // First, look for store capsule anchors that reference this appid and take their nearby text
+    let snippet = '';
+    for (const a of b.querySelectorAll('a.store_capsule, a.app_impression_tracked, a')) {
+      const dsAppid = a.getAttribute('data-ds-appid') || '';
+      const href = a.getAttribute('href') || '';
+      if (dsAppid === appid || href.includes(appHref) || href.includes(appParam)) {
+        const txtEl = a.querySelector('div.text') || (a.parentElement && a.parentElement.querySelector('div.text'));
+        if (txtEl && usable(text(txtEl))) { snippet = text(txtEl); break; }
+      }
+    }
+    // fallback to generic selectors if we didn't find a targeted snippet
+    // (one combined query; selector priority is kept by picking per selector from its matches)
+    if (!snippet) {
+      const matches = Array.from(b.querySelectorAll(snippetSelector));
+      for (const sel of snippetSelectors) {
+        const el = matches.find(m => m.matches(sel));
+        if (el && usable(text(el))) { snippet = text(el); break; }
+      }
+    }
+    return {
+      name: nameEl ? text(nameEl) : 'N/A',
+      profileLink: profileEl ? (profileEl.getAttribute('href') || '') : '',
+      followers: followersEl ? text(followersEl) : 'N/A',
+      snippet: snippet.replace(/\\n/g, ' ').slice(0, 800),
+    };
+  });
+}"""
+
+# Scroll until the curator count is stable for 3 rounds (maxRounds is a safety cap in case
+# the site never reports stability); returns [rounds, count]
+SCROLL_UNTIL_END_JS = """async ({wait, maxRounds}) => {
+  let prev = 0, stable = 0, rounds = 0;
+  while (rounds < maxRounds) {
+    window.scrollBy(0, document.body.scrollHeight);
+    await new Promise(r => setTimeout(r, wait));
+    const n = document.querySelectorAll('div.curator_page').length;
+    rounds++;
+    if (n === prev) {
+      if (++stable >= 3) break;
+    } else {
+      stable = 0;
+      prev = n;
+    }
+  }
+  return [rounds, prev];
+}"""
+
+
+async def block_heavy_resources(route):
+    """Route handler: abort images/media/fonts and analytics requests, continue everything else."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-async def extract_email_from_text(text: str):
-    """Extract the first email found in a text block.
+def email_from_link(href: str, text: str) -> str:
+    """Return the email address behind a curator link, given its href and visible text.
 
-    Return an empty string when no email is found (preferred for CSV sorting/filtering).
+    Returns an empty string if no email is found.
     """
-    if not text:
-        return ""
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
-    return match.group(0) if match else ""
+    # Visible text first, then the decoded href (mailto: or an address in the query string).
+    # An '@' with no domain after it, as in 'https://www.youtube.com/@TrendAddictGames',
+    # is not an email; such links are kept as external_site only.
+    return find_email(text) or find_email(href) or ""
+
 
+def first_review_text(review_blocks):
+    """Review-page rule: text of the first element of the first selector that has a usable one."""
+    for blocks in review_blocks:
+        if not blocks:
+            continue
+        txt = blocks[0]["text"]
+        if txt and "no more reviews" not in txt.lower():
+            return txt.replace("\n", " ")[:1200]
+    return ""
 
-async def extract_email_from_link(elem):
-    """Extract email from a <a class='curator_url'> element, only the address.
 
-    Returns (href, email) where email is empty string if not found.
+def pick_profile_review(review_blocks, app_name=None):
+    """Profile-page rule: prefer a review linking to (or naming) the game, else the first usable one."""
+    sample_review = ""
+    for blocks in review_blocks:
+        if not blocks:
+            continue
+        found_review = None
+        for block in blocks:
+            txt = block["text"]
+            # ignore Steam's generic no-results text
+            if "no more reviews" in txt.lower():
+                continue
+            if block["appLink"] or (app_name and app_name.lower() in txt.lower()):
+                found_review = txt
+                break
+        if found_review:
+            return found_review.replace("\n", " ")[:1200]
+        # fallback: if no matching review found yet, keep the first available as fallback
+        if not sample_review:
+            first_txt = blocks[0]["text"]
+            if first_txt and "no more reviews" not in first_txt.lower():
+                sample_review = first_txt.replace("\n", " ")[:1200]
+    return sample_review
+
+
+def clean_about(text):
+    """Strip the FOLLOWERS / REVIEWS / POSTED noise from an about text and collapse whitespace."""
+    text = ABOUT_FOLLOWERS_RE.sub("", text)
+    text = ABOUT_REVIEWS_RE.sub("", text)
+    text = ABOUT_POSTED_RE.sub("", text)
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalise_about(about_text):
+    """Trim quotes/whitespace, clamp to 800 chars and clean an extracted About text."""
+    about_text = about_text.strip(' \t\n\r"\'“”')
+    about_text = MULTISPACE_RE.sub(' ', about_text)
+    return clean_about(about_text[:800])
+
+
+def about_from_ld_json(scripts):
+    """Return the first description found in a list of JSON-LD script bodies."""
+    for raw in scripts:
+        try:
+            obj = json.loads(raw or '')
+        except Exception:
+            continue
+        desc = None
+        if isinstance(obj, dict):
+            desc = obj.get('description') or obj.get('about')
+        elif isinstance(obj, list):
+            for item in obj:
+                if isinstance(item, dict) and item.get('description'):
+                    desc = item.get('description')
+                    break
+        if desc:
+            return str(desc).strip()
+    return ""
+
+
+def about_from_body(body):
+    """Last-resort heuristic: the first long paragraph before the FOLLOWERS/REVIEWS block."""
+    # split on follower/reviews markers and prefer text before them
+    parts = FOLLOWERS_SPLIT_RE.split(body)
+    candidate = parts[0] if parts else body
+    # If the candidate is too short, search for first long paragraph
+    if len(candidate) > 40:
+        return candidate
+    for line in body.splitlines():
+        t = line.strip()
+        if len(t) > 40 and not PROFILE_STATS_RE.search(t):
+            return t
+    return ""
+
+
+def fetch_soup(url: str, name: str):
+    """Sync helper: GET a Steam page over the shared session and parse it; None on failure.
+
+    The session's adapter already retries connection errors and timeouts.
     """
-    if not elem:
-        return "", ""
-    href = await elem.get_attribute("href") or ""
-    text = await elem.inner_text() or ""
-    email = ""
-
-    # Try to extract email from the visible text
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
-    if match:
-        email = match.group(0)
-    else:
-        # fallback: decode href
-        decoded = urllib.parse.unquote(href)
-        # Explicit mailto: should always be treated as an email
-        if decoded.lower().startswith("mailto:"):
-            email = decoded.split("mailto:")[-1]
+    try:
+        resp = _STEAM_SESSION.get(url, timeout=NAV_TIMEOUT_MS / 1000)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        print(f"[{name}] Failed to fetch {url}: {e}")
+        return None
+    return BeautifulSoup(resp.text, "lxml")
+
+
+def element_text(el, sep="\n"):
+    """Rendered-ish text of an element (the parser-side stand-in for innerText)."""
+    return el.get_text(sep, strip=True) if el is not None else ""
+
+
+def page_text(soup):
+    """Visible body text: script/style contents are dropped first, as innerText would."""
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    return element_text(soup.body)
+
+
+def selector_about_text(soup):
+    """Text of the first ABOUT_TEXT_SELECTORS match (its <p> children joined when it has any)."""
+    for sel in ABOUT_TEXT_SELECTORS:
+        el = soup.select_one(sel)
+        if el is None:
+            continue
+        ps = el.find_all("p")
+        if ps:
+            t = " ".join(filter(None, (element_text(p, " ") for p in ps)))
         else:
-            # If the href looks like a URL (http(s)://...), only treat it as an email
-            # if an email-like pattern appears in the URL (e.g., mailto or query params).
-            # This prevents YouTube style handles like 'https://www.youtube.com/@TrendAddictGames'
-            # from being mistaken for an email address.
-            url_like = decoded.lower().startswith("http://") or decoded.lower().startswith("https://")
-            # Search for a proper email pattern anywhere in the decoded href/text
-            match2 = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", decoded)
-            if match2:
-                email = match2.group(0)
-            else:
-                # As a last resort (non-URL raw strings), if there's an '@' but no email pattern,
-                # don't treat it as an email — keep it as external_site only.
-                email = ""
-    return href, email
+            t = element_text(el)
+        if t:
+            return t
+    return ""
+
+
+def profile_data(soup, base_url, appid=""):
+    """Read followers, external link, review candidates, About link/text and any mailto from a profile page."""
+    followers_el = soup.select_one("div.followers span")
+    site_el = soup.select_one("a.curator_url.ttip")
+    about_el = soup.select_one("a.about")
+    mail = soup.select_one("a[href^='mailto:']")
+    # first link on the page that references the appid (review or store page)
+    candidate_review_href = None
+    if appid:
+        for a in soup.find_all("a", href=True):
+            if appid in a["href"]:
+                candidate_review_href = urllib.parse.urljoin(base_url, a["href"])
+                break
+    review_blocks = [
+        [
+            {
+                "text": element_text(el),
+                "appLink": bool(appid) and any(appid in a["href"] for a in el.find_all("a", href=True)),
+            }
+            for el in soup.select(sel)
+        ]
+        for sel in REVIEW_PAGE_SELECTORS
+    ]
+    return {
+        "followers": element_text(followers_el) if followers_el is not None else None,
+        "siteHref": (site_el.get("href") or "") if site_el is not None else None,
+        "siteText": element_text(site_el, " "),
+        "candidateReviewHref": candidate_review_href,
+        "reviewBlocks": review_blocks,
+        "aboutHref": (about_el.get("href") or "") if about_el is not None else None,
+        "aboutText": selector_about_text(soup),
+        "mailtoHref": (mail.get("href") or "") if mail is not None else "",
+        "body": page_text(soup),
+    }
+
+
+def about_data(soup):
+    """Read the About text candidates and a mailto link from a curator About page."""
+    meta = soup.select_one('meta[name="description"], meta[property="og:description"]')
+    mail = soup.select_one("a[href^='mailto:']")
+    ld_json = [s.get_text() for s in soup.select('script[type="application/ld+json"]')]
+    return {
+        "aboutText": selector_about_text(soup),
+        "metaDescription": (meta.get("content") or "").strip() if meta is not None else "",
+        "ldJson": ld_json,
+        "mailtoHref": (mail.get("href") or "") if mail is not None else "",
+        "body": page_text(soup),
+    }
+
+
+async def scrape_reviews(page_data, appid, name, app_name=None, listing_review=""):
+    """Pick a sample review for a curator whose profile was read into `page_data`.
+
+    A snippet already found on the listing wins outright (no extra request); otherwise
+    prefers the review/store page the profile links to for the appid, then review blocks
+    on whatever page we end up on.
+    """
+    if listing_review:
+        return listing_review
+    sample_review = ""
+    candidate_review_href = page_data["candidateReviewHref"]
+    if candidate_review_href:
+        soup = await asyncio.to_thread(fetch_soup, candidate_review_href, name)
+        if soup is not None:
+            page_data = profile_data(soup, candidate_review_href, appid)
+            sample_review = first_review_text(page_data["reviewBlocks"])
+    return sample_review or pick_profile_review(page_data["reviewBlocks"], app_name)
+
+
+async def scrape_about(about_url, profile_link, name):
+    """Fetch a curator's About page and return (about_me, email, body_text)."""
+    # The About link is normally a real URL; otherwise use Steam's /about/ path under the profile
+    if about_url and (about_url.startswith('http') or about_url.startswith('/')):
+        about_url = urllib.parse.urljoin(profile_link, about_url)
+    else:
+        about_url = profile_link.rstrip('/') + '/about/'
+
+    soup = await asyncio.to_thread(fetch_soup, about_url, name)
+    if soup is None:
+        return "", "", None
+    html = str(soup)
+    about = about_data(soup)
+    body_text = about["body"]
+
+    # Selector text first, then meta description, JSON-LD and finally the body heuristic
+    about_text = (
+        about["aboutText"]
+        or about["metaDescription"]
+        or about_from_ld_json(about["ldJson"])
+        or about_from_body(body_text)
+    )
+
+    # If still empty, write a small HTML snapshot to debug folder for manual inspection
+    if not about_text:
+        try:
+            os.makedirs(shared_paths.DEBUG_DIR, exist_ok=True)
+            safe_name = UNSAFE_FILENAME_RE.sub('_', name)[:50] or 'unknown'
+            snap = f"{shared_paths.DEBUG_DIR}/{safe_name}_{int(time.time())}.html"
+            with open(snap, 'w', encoding='utf-8') as fh:
+                fh.write(html[:200000])
+            print(f"[DEBUG] About missing - saved snapshot: {snap}")
+        except Exception:
+            pass
+
+    # Normalise, clamp and remove unwanted follower/reviews noise
+    about_me = ""
+    if about_text:
+        about_me = normalise_about(about_text)
+        print(f"[DEBUG] Extracted 'about_me' from About page: {about_me}")
 
+    return about_me, find_email(about["mailtoHref"]) or "", body_text
 
-async def process_curator(curator, page_pool, appid=None, app_name=None, listing_review=None):
-    """Scrape info from a single curator block using a pooled page.
+
+async def process_curator_by_url(profile_link, name, followers=None, appid=None, app_name=None, listing_review=None):
+    """Fetch a curator profile URL over HTTP and extract details.
+
+    Steam renders curator profile and About pages server-side, so they are fetched with
+    the shared requests session and parsed with BeautifulSoup instead of loading them in
+    a browser page. The review lookup and the About page are independent, so they are
+    fetched concurrently. The About page is skipped when the profile page already shows
+    both an email and the About text.
 
     Notes:
     - email fields default to empty string when not found
     - external_site defaults to empty string
     """
-    name = "N/A"
-    profile_link = ""
-    followers = "N/A"
     about_me = ""
     sample_review = ""
+    external_site = ""
+    email_found = ""
+    # Start with the followers value extracted from the listing (if provided)
+    followers = followers or "N/A"
     reviews_count = 0
+    appid_str = str(appid) if appid else ""
+
+    if not profile_link:
+        return {
+            "curator_name": name or 'N/A',
+            "steam_profile": profile_link or '',
+            "followers": followers,
+            "external_site": external_site,
+            "about_me": about_me,
+            "sample_review": sample_review,
+            "reviews": reviews_count,
+            "email": email_found,
+        }
+
+    # Sample review extraction: prefer listing_review provided earlier (also kept if the profile fails)
+    listing_snippet = (listing_review or "").strip()[:800]
+    sample_review = listing_snippet
+
     try:
-        # Basic info (from the listing block)
-        name_elem = await curator.query_selector("div.name span")
-        name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
+        soup = await asyncio.to_thread(fetch_soup, profile_link, name)
+        if soup is None:
+            raise RuntimeError("profile page could not be fetched")
+
+        # followers, external link, review candidates and the About link
+        page_data = profile_data(soup, profile_link, appid_str)
+
+        # Try to find followers on the profile page
+        if page_data["followers"] is not None:
+            followers = page_data["followers"] or 'N/A'
+
+        # External link under profile name
+        if page_data["siteHref"] is not None:
+            external_site = page_data["siteHref"]
+            email_from_link_text = email_from_link(page_data["siteHref"], page_data["siteText"])
+            if email_from_link_text:
+                email_found = email_from_link_text
+
+        # Most curators publish their address on the profile page itself: a mailto link or the
+        # About text shown there (not the whole body, which also carries review/game excerpts)
+        if not email_found:
+            email_found = find_email(page_data["mailtoHref"]) or find_email(page_data["aboutText"]) or ""
+
+        review_job = scrape_reviews(page_data, appid_str, name, app_name, listing_snippet)
+
+        # About page (may contain an email and about text), fetched alongside the reviews
+        body_text = None
+        about_url = page_data["aboutHref"]
+        if email_found and page_data["aboutText"]:
+            about_me = normalise_about(page_data["aboutText"])
+            about_url = None
+        if about_url is not None:
+            sample_review, about = await asyncio.gather(
+                review_job, scrape_about(about_url, profile_link, name), return_exceptions=True
+            )
+            if isinstance(sample_review, Exception):
+                sample_review = listing_snippet
+            if not isinstance(about, Exception):
+                about_me, about_email, body_text = about
+                # Use the About page email if we don't already have one
+                if not email_found and about_email:
+                    email_found = about_email
+                    print(f"[DEBUG] Extracted email from About page: {email_found}")
+        else:
+            try:
+                sample_review = await review_job
+            except Exception:
+                sample_review = listing_snippet
+
+        # If we still don't have a reviews_count, try scanning the page body for a reviews badge
+        if not reviews_count:
+            if body_text is None:
+                body_text = page_data["body"]
+            m2 = REVIEWS_COUNT_RE.search(body_text)
+            if m2:
+                try:
+                    reviews_count = int(m2.group(1).replace(",", ""))
+                    print(f"[DEBUG] Extracted 'reviews_count': {reviews_count}")
+                except Exception as e:
+                    print(f"[DEBUG] Failed to parse 'reviews_count': {e}")
+            else:
+                print("[DEBUG] No match found for 'reviews_count' in body text.")
 
-        profile_elem = await curator.query_selector("a.profile_avatar")
-        profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
+    except Exception as e:
+        print(f"[{name}] Error when visiting profile: {e}")
 
-        follower_elem = await curator.query_selector("div.followers span")
-        followers = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
+    return {
+        "curator_name": name or 'N/A',
+        "steam_profile": profile_link or '',
+        "followers": followers,
+        "external_site": external_site,
+        "about_me": about_me,
+        "sample_review": sample_review,
+        "reviews": reviews_count,
+        "email": email_found,
+    }
 
-        # NOTE: we intentionally drop the per-listing 'recommendation' value (not useful)
 
-        external_site = ""
-        email_found = ""  # blank means no email found
+# Per-curator fields kept in the aggregator and the progress database (games/new are stored alongside)
+CURATOR_FIELDS = ("curator_name", "steam_profile", "followers", "reviews", "external_site", "about_me", "sample_review", "email")
 
-        # If the listing already contains a review snippet (recommended), prefer it
-        if listing_review and not sample_review:
-            try:
-                sample_review = (listing_review or "").strip()[:800]
-            except Exception:
-                pass
 
-        if profile_link:
-            # acquire a page from the pool (this will block until available)
-            page2 = await page_pool.get()
-            try:
-                try:
-                    await page2.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-                except Exception:
-                    pass
-                try:
-                    await page2.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-                except Exception:
-                    pass
+class Curator:
+    """One aggregated curator: its fields plus the set of games it reviews.
 
-                # Retry navigating to profile
-                for attempt in range(NAV_RETRIES + 1):
-                    try:
-                        await page2.goto(profile_link, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                        break
-                    except PlaywrightTimeoutError:
-                        if attempt < NAV_RETRIES:
-                            await asyncio.sleep(NAV_RETRY_SLEEP)
-                        else:
-                            print(f"[{name}] Timeout navigating to profile after {NAV_RETRIES+1} attempts")
-
-                # External link under profile name
-                site_link_el = await page2.query_selector("a.curator_url.ttip")
-                if site_link_el:
-                    external_site, email_from_link = await extract_email_from_link(site_link_el)
-                    if email_from_link:
-                        email_found = email_from_link
-
-                # Try to capture a short sample review from the profile that matches the current appid.
-                # First, look for a direct link on the profile that points to a review/store page for this appid;
-                # if found, navigate to that URL and extract the review text there (preferred). Otherwise
-                # fall back to scanning review blocks on the profile page.
-                try:
-                    review_page_selectors = [
-                        "div.apphub_UserReviewCardContent", "div.review_box", "div.user_review",
-                        "div.review_body", "div.review_text", "div.reviews p", "div.text"
-                    ]
+    Uses __slots__ instead of a {'data': {...}, 'games': set()} dict pair, which keeps
+    large --input-csv preloads several times smaller in memory.
+    """
+    __slots__ = CURATOR_FIELDS + ("games",)
 
-                    # Look for anchors on the profile page linking to the store/review for this appid
-                    candidate_review_href = None
-                    try:
-                        anchors = await page2.query_selector_all('a')
-                        for a in anchors:
-                            ahref = await a.get_attribute('href') or ''
-                            if not ahref:
-                                continue
-                            # Normalize and detect appid mentions in href (common patterns)
-                            if appid and (f"/app/{appid}" in ahref or f"app={appid}" in ahref or re.search(rf"{re.escape(str(appid))}", ahref)):
-                                candidate_review_href = urllib.parse.urljoin(page2.url, ahref)
-                                break
-                    except Exception:
-                        candidate_review_href = None
-
-                    # If we found a candidate review link, try to open and extract its review text
-                    if candidate_review_href:
-                        try:
-                            await page2.goto(candidate_review_href, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                            # try multiple selectors on the review page
-                            for sel in review_page_selectors:
-                                try:
-                                    rev_el = await page2.query_selector(sel)
-                                    if rev_el:
-                                        txt = (await rev_el.inner_text() or "").strip()
-                                        if txt:
-                                            # ignore Steam's "no more reviews that match the filters" placeholder
-                                            if "no more reviews" in txt.lower():
-                                                continue
-                                            sample_review = txt.replace("\n", " ")[:1200]
-                                            break
-                                except Exception:
-                                    continue
-                        except Exception:
-                            # If navigation to the candidate link failed, ignore and fall back
-                            sample_review = sample_review or ""
-
-                    # If no candidate link or extraction failed, fall back to scanning review blocks on profile page
-                    if not sample_review:
-                        for sel in review_page_selectors:
-                            try:
-                                rev_els = await page2.query_selector_all(sel)
-                                if not rev_els:
-                                    continue
-                                # prefer a review that mentions the appid (or app_name) inside the review element or its anchors
-                                found_review = None
-                                for rev_el in rev_els:
-                                    try:
-                                        txt = (await rev_el.inner_text() or "").strip()
-                                        # ignore Steam's generic no-results text
-                                        if "no more reviews" in (txt or "").lower():
-                                            continue
-                                        anchors = await rev_el.query_selector_all('a')
-                                        matched = False
-                                        for a in anchors:
-                                            ahref = await a.get_attribute('href') or ''
-                                            if ahref and appid and re.search(rf"{re.escape(str(appid))}", ahref):
-                                                matched = True
-                                                break
-                                        if not matched and app_name and app_name.lower() in (txt or "").lower():
-                                            matched = True
-                                        if matched:
-                                            found_review = txt
-                                            break
-                                    except Exception:
-                                        continue
-                                if found_review:
-                                    sample_review = found_review.replace("\n", " ")[:1200]
-                                    break
-                                # fallback: if no matching review found yet, keep the first available as fallback
-                                if not sample_review and rev_els:
-                                    try:
-                                        first_txt = (await rev_els[0].inner_text() or "").strip()
-                                        if first_txt and "no more reviews" not in first_txt.lower():
-                                            sample_review = first_txt.replace("\n", " ")[:1200]
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                continue
-
-                except Exception:
-                    # Non-fatal: leave sample_review empty if anything fails
-                    sample_review = sample_review or ""
-
-                # About page (may contain an email and about text)
-                try:
-                    about_link_el = await page2.query_selector("a.about")
-                    if about_link_el:
-                        about_url = await about_link_el.get_attribute("href")
-                        navigated = False
-
-                        # Prefer navigation when href looks like a real URL, otherwise try click
-                        if about_url and (about_url.startswith('http') or about_url.startswith('/')):
-                            for attempt in range(NAV_RETRIES + 2):
-                                try:
-                                    await page2.goto(about_url, timeout=NAV_TIMEOUT_MS, wait_until='networkidle')
-                                    navigated = True
-                                    break
-                                except PlaywrightTimeoutError:
-                                    if attempt < NAV_RETRIES + 1:
-                                        await asyncio.sleep(NAV_RETRY_SLEEP)
-                                    else:
-                                        print(f"[{name}] Timeout navigating to About page after {NAV_RETRIES + 2} attempts")
-                        else:
-                            try:
-                                await about_link_el.click()
-                                try:
-                                    await page2.wait_for_load_state('networkidle', timeout=10000)
-                                except Exception:
-                                    pass
-                                navigated = True
-                            except Exception:
-                                pass
-
-                        # Wait a bit longer for dynamic content to render
-                        try:
-                            await page2.wait_for_selector("div.about_container div.desc, div.desc, div.profile_about", timeout=10000)
-                        except Exception:
-                            pass
-
-                        # Try a set of concrete selectors (prefer the tagline inside about_container)
-                        about_text = ""
-                        for sel in (
-                            "div.about_container div.desc p.tagline",
-                            "div.about_container div.desc",
-                            "div.desc p",
-                            "div.desc",
-                            "div.profile_about",
-                            "div.curator_about",
-                        ):
-                            try:
-                                el = await page2.query_selector(sel)
-                                if el:
-                                    # If element has multiple <p> children, join them (preserves paragraphs)
-                                    try:
-                                        pchildren = await el.query_selector_all('p')
-                                        if pchildren:
-                                            parts = []
-                                            for p in pchildren:
-                                                try:
-                                                    t = (await p.inner_text()) or ''
-                                                    t = t.strip()
-                                                    if t:
-                                                        parts.append(t)
-                                                except Exception:
-                                                    continue
-                                            txt = ' '.join(parts).strip()
-                                        else:
-                                            txt = (await el.inner_text()) or ''
-                                    except Exception:
-                                        txt = (await el.inner_text()) or ''
-
-                                    txt = (txt or '').strip()
-                                    if txt:
-                                        about_text = txt
-                                        break
-                            except Exception:
-                                continue
-
-                        # Fallback: meta description / og:description
-                        if not about_text:
-                            try:
-                                meta = await page2.query_selector('meta[name="description"], meta[property="og:description"]')
-                                if meta:
-                                    about_text = (await meta.get_attribute('content') or '').strip()
-                            except Exception:
-                                pass
-
-                        # Fallback: JSON-LD description
-                        if not about_text:
-                            try:
-                                scripts = await page2.query_selector_all('script[type="application/ld+json"]')
-                                for s in scripts:
-                                    try:
-                                        raw = (await s.inner_text()) or ''
-                                        obj = json.loads(raw)
-                                        desc = None
-                                        if isinstance(obj, dict):
-                                            desc = obj.get('description') or obj.get('about')
-                                        elif isinstance(obj, list):
-                                            for item in obj:
-                                                if isinstance(item, dict) and item.get('description'):
-                                                    desc = item.get('description')
-                                                    break
-                                        if desc:
-                                            about_text = str(desc).strip()
-                                            break
-                                    except Exception:
-                                        continue
-                            except Exception:
-                                pass
-
-                        # Last-resort heuristic: pick the first long body paragraph before FOLLOWERS/REVIEWS block
-                        if not about_text:
-                            try:
-                                body = (await page2.inner_text('body') or '').strip()
-                                # split on follower/reviews markers and prefer text before them
-                                parts = re.split(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b", body, flags=re.I)
-                                candidate = parts[0] if parts else body
-                                # If the candidate is too short, search for first long paragraph
-                                if len(candidate) > 40:
-                                    about_text = candidate
-                                else:
-                                    for line in body.splitlines():
-                                        t = line.strip()
-                                        if len(t) > 40 and not re.search(r'FOLLOWERS|REVIEWS|POSTED', t, flags=re.I):
-                                            about_text = t
-                                            break
-                            except Exception:
-                                pass
-
-                        # If still empty, write a small HTML snapshot to debug folder for manual inspection
-                        if not about_text:
-                            try:
-                                os.makedirs(shared_paths.DEBUG_DIR, exist_ok=True)
-                                safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', name)[:50] or 'unknown'
-                                snap = f"{shared_paths.DEBUG_DIR}/{safe_name}_{int(time.time())}.html"
-                                html = await page2.content()
-                                with open(snap, 'w', encoding='utf-8') as fh:
-                                    fh.write(html[:200000])
-                                print(f"[DEBUG] About missing - saved snapshot: {snap}")
-                            except Exception:
-                                pass
-
-                        # Normalise and clamp
-                        if about_text:
-                            about_text = about_text.strip(' \t\n\r"\'“”')
-                            about_text = re.sub(r'\s{2,}', ' ', about_text)
-                            about_me = about_text[:800]
-                            print(f"[DEBUG] Extracted 'about_me' from About page: {about_me}")
-
-                        # Try to extract an email on the About page if we don't already have one
-                        if not email_found:
-                            try:
-                                mail_el = await page2.query_selector("a[href^='mailto:']")
-                                if mail_el:
-                                    href = await mail_el.get_attribute('href') or ''
-                                    m = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", href)
-                                    if m:
-                                        email_found = m.group(0)
-                                        print(f"[DEBUG] Extracted email from About page: {email_found}")
-                            except Exception:
-                                pass
-
-                        # Clean the 'about_me' field to remove unwanted follower/reviews noise
-                        if about_me:
-                            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\bPOSTED\b", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\s+", " ", about_me).strip()
-                except Exception:
-                    pass
+    def __init__(self, record, games=()):
+        for f in CURATOR_FIELDS:
+            setattr(self, f, record.get(f, ""))
+        self.games = set(games)
 
-                # If we still don't have a reviews_count, try scanning the page body for a reviews badge
-                if not reviews_count:
-                    try:
-                        body_text = (await page2.inner_text('body') or "").strip()
-                        m2 = re.search(r"([\d,]+)\s*(?:REVIEWS|REVIEWS POSTED|POSTED)", body_text, flags=re.I)
-                        if m2:
-                            try:
-                                reviews_count = int(m2.group(1).replace(",", ""))
-                                print(f"[DEBUG] Extracted 'reviews_count': {reviews_count}")
-                            except Exception as e:
-                                print(f"[DEBUG] Failed to parse 'reviews_count': {e}")
-                        else:
-                            print("[DEBUG] No match found for 'reviews_count' in body text.")
-                    except Exception as e:
-                        print(f"[DEBUG] Failed to extract 'reviews_count' from body: {e}")
+    def record(self):
+        return {f: getattr(self, f) for f in CURATOR_FIELDS}
 
-            except PlaywrightTimeoutError:
-                print(f"[{name}] Timeout on profile page")
-            except Exception as e:
-                print(f"[{name}] Error when visiting profile: {e}")
-            finally:
-                try:
-                    await page2.goto('about:blank', timeout=5000)
-                except Exception:
-                    pass
-                await page_pool.put(page2)
 
-        return {
-            "curator_name": name,
-            "steam_profile": profile_link,
-            "followers": followers,
-            "external_site": external_site,
-            "about_me": about_me,
-            "sample_review": sample_review,
-            "email": email_found,
-            "reviews": reviews_count,
-        }
+def open_progress_db(path: str, run_key: str):
+    """Open (or create) the per-run progress database used to resume after a crash.
 
-    except Exception as e:
-        print(f"[{name if name else 'N/A'}] Error processing profile: {e}")
-        return {
-            "curator_name": name if name else "N/A",
-            "steam_profile": profile_link if profile_link else "",
-            "followers": followers if followers else "N/A",
-            "external_site": "",
-            "about_me": "",
-            "sample_review": "",
-            "email": "",
-            "reviews": reviews_count,
-        }
+    Returns (conn, resumable). The database records the run it belongs to (game list and
+    input CSV); one left behind by a different run is cleared instead of resumed.
+    """
+    # writes happen on worker threads (see save_progress), one at a time under a lock
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    cols = ", ".join(CURATOR_FIELDS)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS curators (key TEXT PRIMARY KEY, {cols}, games TEXT, new INTEGER)")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+    row = conn.execute("SELECT value FROM meta WHERE name = 'run'").fetchone()
+    resumable = row is not None and row[0] == run_key
+    if not resumable:
+        with conn:
+            conn.execute("DELETE FROM curators")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('run', ?)", (run_key,))
+    return conn, resumable
+
+
+def load_progress(conn):
+    """Return (aggregated, new_keys) rebuilt from the progress database."""
+    agg = {}
+    new_keys = set()
+    cols = ", ".join(CURATOR_FIELDS)
+    for row in conn.execute(f"SELECT key, {cols}, games, new FROM curators"):
+        key, values, games, new = row[0], row[1:-2], row[-2], row[-1]
+        rec = dict(zip(CURATOR_FIELDS, values))
+        rec["reviews"] = int(rec.get("reviews") or 0)
+        agg[key] = Curator(rec, (g for g in (games or "").split(";") if g))
+        if new:
+            new_keys.add(key)
+    return agg, new_keys
+
+
+def progress_rows(aggregated, keys, newly_added_keys):
+    """Snapshot the given aggregated entries as progress database rows."""
+    rows = []
+    for key in keys:
+        entry = aggregated[key]
+        rows.append(
+            [key] + [getattr(entry, f) for f in CURATOR_FIELDS]
+            + [";".join(sorted(entry.games)), 1 if key in newly_added_keys else 0]
+        )
+    return rows
+
+
+def save_progress(conn, rows):
+    """Upsert progress rows in a single transaction (blocking; run it via asyncio.to_thread)."""
+    placeholders = ", ".join("?" * (len(CURATOR_FIELDS) + 3))
+    with conn:
+        conn.executemany(f"INSERT OR REPLACE INTO curators VALUES ({placeholders})", rows)
 
 
 async def main():
@@ -520,7 +662,7 @@ async def main():
     parser.add_argument("--games-file", dest="games_file", help="File with appids (one per line). Overrides RAW_GAME_IDS if provided.")
     parser.add_argument("--appid", dest="single_appid", help="Single Steam appid to scrape (optional)")
     parser.add_argument("--scroll-until-end", dest="scroll_until_end", action="store_true", help="Enable SCROLL_UNTIL_END mode for large listings")
-    parser.add_argument("--concurrency", dest="concurrency", type=int, help="Override MAX_CONCURRENT")
+    parser.add_argument("--concurrency", dest="concurrency", type=int, help="Override MAX_CONCURRENT (falls back to $PLAYWRIGHT_WORKERS)")
     parser.add_argument("--output-file", dest="output_file", help="Force the output CSV filename (optional)")
     parser.add_argument("--export-new-only", dest="export_new_only", action="store_true", help="Export only newly discovered curators (requires --input-csv)")
     # By default the script runs in headless mode to avoid opening visible browser windows.
@@ -537,6 +679,15 @@ async def main():
         SCROLL_UNTIL_END = True
     if args.concurrency:
         MAX_CONCURRENT = max(1, args.concurrency)
+    elif os.environ.get("PLAYWRIGHT_WORKERS", "").isdigit():
+        # set by the Streamlit UI (python_src/steam/app.py)
+        MAX_CONCURRENT = max(1, int(os.environ["PLAYWRIGHT_WORKERS"]))
+
+    # Each worker can have a review page and an About page in flight at once: size the keep-alive
+    # pool and the asyncio.to_thread executor for that, so no fetch waits for a socket or a thread
+    http_slots = 2 * MAX_CONCURRENT
+    _STEAM_SESSION.mount("https://", steam_adapter(max(32, http_slots)))
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=http_slots + 4))
 
     # Determine which games to process (priority: --appid, --games-file, RAW_GAME_IDS)
     game_input = RAW_GAME_IDS
@@ -571,7 +722,7 @@ async def main():
     def load_existing_csv(path: str):
         """Load an existing CSV and return an aggregated dict keyed by steam_profile (fallback to name).
 
-        The returned structure matches the aggregator used later: { key: { 'data': {...}, 'games': set(...) } }
+        The returned structure matches the aggregator used later: { key: Curator }
         """
         agg = {}
         if not path or not os.path.exists(path):
@@ -597,7 +748,7 @@ async def main():
                     'email': r.get('email') or '',
                     'reviews': int(r.get('reviews') or 0) if r.get('reviews') else 0,
                 }
-                agg[key] = {'data': rec, 'games': games}
+                agg[key] = Curator(rec, games)
         return agg
 
     # Load existing CSV into aggregator if provided
@@ -609,17 +760,45 @@ async def main():
     # Track which keys were newly discovered during this run so we can optionally export only new ones
     newly_added_keys = set()
 
+    # Results are checkpointed to a progress database as they come in; if a previous run
+    # for the same games and input CSV crashed, pick up where it stopped. Removed once the
+    # CSV is written.
+    progress_path = f"{OUTPUT_FILE}.progress.sqlite"
+    run_key = json.dumps({
+        "games": GAME_IDS,
+        "input_csv": os.path.abspath(args.input_csv) if args.input_csv else "",
+    })
+    stale = os.path.exists(progress_path)
+    progress_db, resuming = open_progress_db(progress_path, run_key)
+    if resuming:
+        resumed, resumed_new = load_progress(progress_db)
+        aggregated.update(resumed)
+        newly_added_keys |= resumed_new
+        print(f"Resuming: loaded {len(resumed)} curators from {progress_path}")
+    elif stale:
+        print(f"Ignoring {progress_path}: it was left by a run over different games or input CSV")
+    progress_lock = asyncio.Lock()
+
+    async def checkpoint(keys):
+        """Write the given curators to the progress database without blocking the event loop."""
+        rows = progress_rows(aggregated, keys, newly_added_keys)
+        async with progress_lock:
+            await asyncio.to_thread(save_progress, progress_db, rows)
+
     def get_game_name(appid: str) -> str:
         """Sync helper: ask Steam API for friendly name, fallback to id."""
         try:
             url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            resp = requests.get(url, timeout=5).json()
+            resp = _STEAM_SESSION.get(url, timeout=5).json()
             if resp and str(appid) in resp and resp[str(appid)].get("success"):
                 return resp[str(appid)]["data"].get("name", f"Unknown ({appid})")
         except Exception:
             pass
         return f"Unknown ({appid})"
 
+    # Resolve all game names up front, concurrently, instead of one blocking call per game
+    app_names = dict(zip(GAME_IDS, await asyncio.gather(*[asyncio.to_thread(get_game_name, aid) for aid in GAME_IDS])))
+
     # Add retry mechanism for page creation
     async with async_playwright() as p:
         try:
@@ -628,394 +807,35 @@ async def main():
             browser = await p.chromium.launch(headless=headless_mode)  # Toggle headless mode
             print("[DEBUG] Browser launched in headless mode:", headless_mode)
 
-            # Ensure all new pages respect the headless mode
-            page = await browser.new_page()
-            print("[DEBUG] New page created in browser.")
+            # One context for every page: sets the user-agent once and drops heavy resources
+            context = await browser.new_context(user_agent=DEFAULT_USER_AGENT)
+            await context.route("**/*", block_heavy_resources)
+            print("[DEBUG] Browser context created.")
         except Exception as e:
             print(f"[ERROR] Failed during browser or page setup: {e}")
             raise
 
-        # Create a small pool of pages for profile visits (limits visible tabs)
-        # We set the user-agent on each pooled page to reduce bot-detection.
-        page_pool = asyncio.Queue()
-        for _ in range(MAX_CONCURRENT):
-            ppage = await browser.new_page()
-            try:
-                await ppage.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-            except Exception:
-                pass
-            try:
-                await ppage.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-            except Exception:
-                pass
-            await ppage.goto('about:blank')
-            await page_pool.put(ppage)
-
-        # semaphore used by all workers
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-
-        # New: worker that accepts plain data (no ElementHandle) to avoid keeping page handles alive
-        async def process_curator_by_url(profile_link, name, page_pool, followers=None, appid=None, app_name=None, listing_review=None):
-            """Visit a curator profile URL using a pooled page and extract details.
-            This mirrors the logic in process_curator but works from strings only to avoid
-            holding ElementHandle references from the listing page (which Playwright may GC).
-            """
-            about_me = ""
-            sample_review = ""
-            external_site = ""
-            email_found = ""
-            # Start with the followers value extracted from the listing (if provided)
-            followers = followers or "N/A"
-            reviews_count = 0
-
-            if not profile_link:
-                return {
-                    "curator_name": name or 'N/A',
-                    "steam_profile": profile_link or '',
-                    "followers": followers,
-                    "external_site": external_site,
-                    "about_me": about_me,
-                    "sample_review": sample_review,
-                    "reviews": reviews_count,
-                    "email": email_found,
-                }
-
-            page2 = await page_pool.get()
-            try:
-                try:
-                    await page2.set_default_navigation_timeout(NAV_TIMEOUT_MS)
-                except Exception:
-                    pass
-                try:
-                    await page2.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
-                except Exception:
-                    pass
-
-                # Retry navigating to profile
-                for attempt in range(NAV_RETRIES + 1):
-                    try:
-                        await page2.goto(profile_link, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                        break
-                    except PlaywrightTimeoutError:
-                        if attempt < NAV_RETRIES:
-                            await asyncio.sleep(NAV_RETRY_SLEEP)
-                        else:
-                            print(f"[{name}] Timeout navigating to profile after {NAV_RETRIES+1} attempts")
-
-                # Try to find followers on the profile page
-                try:
-                    follower_elem = await page2.query_selector("div.followers span")
-                    if follower_elem:
-                        followers = (await follower_elem.inner_text()).strip() or 'N/A'
-                except Exception:
-                    pass
-
-                # External link under profile name
-                try:
-                    site_link_el = await page2.query_selector("a.curator_url.ttip")
-                    if site_link_el:
-                        external_site, email_from_link = await extract_email_from_link(site_link_el)
-                        if email_from_link:
-                            email_found = email_from_link
-                except Exception:
-                    pass
-
-                # Sample review extraction: prefer listing_review provided earlier
-                if listing_review and not sample_review:
-                    try:
-                        sample_review = (listing_review or "").strip()[:800]
-                    except Exception:
-                        pass
-
-                # Search for candidate review links or review blocks on the profile page
-                try:
-                    review_page_selectors = [
-                        "div.apphub_UserReviewCardContent", "div.review_box", "div.user_review",
-                        "div.review_body", "div.review_text", "div.reviews p", "div.text"
-                    ]
-
-                    candidate_review_href = None
-                    try:
-                        anchors = await page2.query_selector_all('a')
-                        for a in anchors:
-                            ahref = await a.get_attribute('href') or ''
-                            if not ahref:
-                                continue
-                            if appid and (f"/app/{appid}" in ahref or f"app={appid}" in ahref or re.search(rf"{re.escape(str(appid))}", ahref)):
-                                candidate_review_href = urllib.parse.urljoin(page2.url, ahref)
-                                break
-                    except Exception:
-                        candidate_review_href = None
-
-                    if candidate_review_href:
-                        try:
-                            await page2.goto(candidate_review_href, timeout=NAV_TIMEOUT_MS, wait_until="domcontentloaded")
-                            for sel in review_page_selectors:
-                                try:
-                                    rev_el = await page2.query_selector(sel)
-                                    if rev_el:
-                                        txt = (await rev_el.inner_text()).strip()
-                                        if txt and "no more reviews" not in txt.lower():
-                                            sample_review = txt.replace("\n", " ")[:1200]
-                                            break
-                                except Exception:
-                                    continue
-                        except Exception:
-                            sample_review = sample_review or ""
-
-                    if not sample_review:
-                        for sel in review_page_selectors:
-                            try:
-                                rev_els = await page2.query_selector_all(sel)
-                                if not rev_els:
-                                    continue
-                                found_review = None
-                                for rev_el in rev_els:
-                                    try:
-                                        txt = (await rev_el.inner_text()).strip()
-                                        if "no more reviews" in (txt or "").lower():
-                                            continue
-                                        anchors = await rev_el.query_selector_all('a')
-                                        matched = False
-                                        for a in anchors:
-                                            ahref = await a.get_attribute('href') or ''
-                                            if ahref and appid and re.search(rf"{re.escape(str(appid))}", ahref):
-                                                matched = True
-                                                break
-                                        if not matched and app_name and app_name.lower() in (txt or "").lower():
-                                            matched = True
-                                        if matched:
-                                            found_review = txt
-                                            break
-                                    except Exception:
-                                        continue
-                                if found_review:
-                                    sample_review = found_review.replace("\n", " ")[:1200]
-                                    break
-                                if not sample_review and rev_els:
-                                    try:
-                                        first_txt = (await rev_els[0].inner_text()).strip()
-                                        if first_txt and "no more reviews" not in first_txt.lower():
-                                            sample_review = first_txt.replace("\n", " ")[:1200]
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                continue
-                except Exception:
-                    sample_review = sample_review or ""
-
-                # About page (may contain an email and about text)
-                try:
-                    about_link_el = await page2.query_selector("a.about")
-                    if about_link_el:
-                        about_url = await about_link_el.get_attribute("href")
-                        navigated = False
-
-                        if about_url and (about_url.startswith('http') or about_url.startswith('/')):
-                            for attempt in range(NAV_RETRIES + 2):
-                                try:
-                                    await page2.goto(about_url, timeout=NAV_TIMEOUT_MS, wait_until='networkidle')
-                                    navigated = True
-                                    break
-                                except PlaywrightTimeoutError:
-                                    if attempt < NAV_RETRIES + 1:
-                                        await asyncio.sleep(NAV_RETRY_SLEEP)
-                                    else:
-                                        print(f"[{name}] Timeout navigating to About page after {NAV_RETRIES + 2} attempts")
-                        else:
-                            try:
-                                await about_link_el.click()
-                                try:
-                                    await page2.wait_for_load_state('networkidle', timeout=10000)
-                                except Exception:
-                                    pass
-                                navigated = True
-                            except Exception:
-                                pass
-
-                        try:
-                            await page2.wait_for_selector("div.about_container div.desc, div.desc, div.profile_about", timeout=10000)
-                        except Exception:
-                            pass
-
-                        about_text = ""
-                        for sel in (
-                            "div.about_container div.desc p.tagline",
-                            "div.about_container div.desc",
-                            "div.desc p",
-                            "div.desc",
-                            "div.profile_about",
-                            "div.curator_about",
-                        ):
-                            try:
-                                el = await page2.query_selector(sel)
-                                if el:
-                                    try:
-                                        pchildren = await el.query_selector_all('p')
-                                        if pchildren:
-                                            parts = []
-                                            for p in pchildren:
-                                                try:
-                                                    t = (await p.inner_text()) or ''
-                                                    t = t.strip()
-                                                    if t:
-                                                        parts.append(t)
-                                                except Exception:
-                                                    continue
-                                            txt = ' '.join(parts).strip()
-                                        else:
-                                            txt = (await el.inner_text()) or ''
-                                    except Exception:
-                                        txt = (await el.inner_text()) or ''
-
-                                    txt = (txt or '').strip()
-                                    if txt:
-                                        about_text = txt
-                                        break
-                            except Exception:
-                                continue
-
-                        if not about_text:
-                            try:
-                                meta = await page2.query_selector('meta[name="description"], meta[property="og:description"]')
-                                if meta:
-                                    about_text = (await meta.get_attribute('content') or '').strip()
-                            except Exception:
-                                pass
-
-                        if not about_text:
-                            try:
-                                scripts = await page2.query_selector_all('script[type="application/ld+json"]')
-                                for s in scripts:
-                                    try:
-                                        raw = (await s.inner_text()) or ''
-                                        obj = json.loads(raw)
-                                        desc = None
-                                        if isinstance(obj, dict):
-                                            desc = obj.get('description') or obj.get('about')
-                                        elif isinstance(obj, list):
-                                            for item in obj:
-                                                if isinstance(item, dict) and item.get('description'):
-                                                    desc = item.get('description')
-                                                    break
-                                        if desc:
-                                            about_text = str(desc).strip()
-                                            break
-                                    except Exception:
-                                        continue
-                            except Exception:
-                                pass
-
-                        if not about_text:
-                            try:
-                                body = (await page2.inner_text('body') or '').strip()
-                                parts = re.split(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b", body, flags=re.I)
-                                candidate = parts[0] if parts else body
-                                if len(candidate) > 40:
-                                    about_text = candidate
-                                else:
-                                    for line in body.splitlines():
-                                        t = line.strip()
-                                        if len(t) > 40 and not re.search(r'FOLLOWERS|REVIEWS|POSTED', t, flags=re.I):
-                                            about_text = t
-                                            break
-                            except Exception:
-                                pass
-
-                        if not about_text:
-                            try:
-                                os.makedirs(shared_paths.DEBUG_DIR, exist_ok=True)
-                                safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', name)[:50] or 'unknown'
-                                snap = f"{shared_paths.DEBUG_DIR}/{safe_name}_{int(time.time())}.html"
-                                html = await page2.content()
-                                with open(snap, 'w', encoding='utf-8') as fh:
-                                    fh.write(html[:200000])
-                                print(f"[DEBUG] About missing - saved snapshot: {snap}")
-                            except Exception:
-                                pass
-
-                        if about_text:
-                            about_text = about_text.strip(' \t\n\r"\'“”')
-                            about_text = re.sub(r'\s{2,}', ' ', about_text)
-                            about_me = about_text[:800]
-                            print(f"[DEBUG] Extracted 'about_me' from About page: {about_me}")
-
-                        if not email_found:
-                            try:
-                                mail_el = await page2.query_selector("a[href^='mailto:']")
-                                if mail_el:
-                                    href = await mail_el.get_attribute('href') or ''
-                                    m = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", href)
-                                    if m:
-                                        email_found = m.group(0)
-                                        print(f"[DEBUG] Extracted email from About page: {email_found}")
-                            except Exception:
-                                pass
-
-                        if about_me:
-                            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\bPOSTED\b", "", about_me, flags=re.I)
-                            about_me = re.sub(r"\s+", " ", about_me).strip()
-                except Exception:
-                    pass
-
-                # If we still don't have a reviews_count, try scanning the page body for a reviews badge
-                try:
-                    if not reviews_count:
-                        try:
-                            body_text = (await page2.inner_text('body') or "").strip()
-                            m2 = re.search(r"([\d,]+)\s*(?:REVIEWS|REVIEWS POSTED|POSTED)", body_text, flags=re.I)
-                            if m2:
-                                try:
-                                    reviews_count = int(m2.group(1).replace(",", ""))
-                                    print(f"[DEBUG] Extracted 'reviews_count': {reviews_count}")
-                                except Exception as e:
-                                    print(f"[DEBUG] Failed to parse 'reviews_count': {e}")
-                            else:
-                                print("[DEBUG] No match found for 'reviews_count' in body text.")
-                        except Exception as e:
-                            print(f"[DEBUG] Failed to extract 'reviews_count' from body: {e}")
-                except Exception:
-                    pass
-
-            except PlaywrightTimeoutError:
-                print(f"[{name}] Timeout on profile page")
-            except Exception as e:
-                print(f"[{name}] Error when visiting profile: {e}")
-            finally:
-                try:
-                    await page2.goto('about:blank', timeout=5000)
-                except Exception:
-                    pass
-                await page_pool.put(page2)
-
-            return {
-                "curator_name": name or 'N/A',
-                "steam_profile": profile_link or '',
-                "followers": followers,
-                "external_site": external_site,
-                "about_me": about_me,
-                "sample_review": sample_review,
-                "reviews": reviews_count,
-                "email": email_found,
-            }
-
-        async def sem_task(curator_data, appid=None, app_name=None, listing_review=None):
-            async with semaphore:
-                # curator_data is a tuple (profile_link, name, followers)
-                profile_link, name, followers = curator_data
-                return await process_curator_by_url(profile_link, name, page_pool, followers=followers, appid=appid, app_name=app_name, listing_review=listing_review)
-
-        # If aggregated was not loaded from CSV earlier, start empty
-        # aggregated variable may already contain preloaded entries
-
-        for appid in GAME_IDS:
-            app_name = get_game_name(appid)
+        # Producer/consumer: one producer per game scrolls its listing and queues plain curator
+        # dicts; MAX_CONCURRENT workers drain the queue across games, so listing loads for the
+        # next game overlap with profile visits for the previous one.
+        curator_queue = asyncio.Queue()
+        listing_semaphore = asyncio.Semaphore(LISTING_CONCURRENCY)
+        # key -> extra games seen for a curator that is queued but not scraped yet
+        queued_games = {}
+        # lightweight membership set for the hot "already seen?" check: every key that is
+        # either aggregated or queued
+        seen_keys = set(aggregated)
+
+        async def scrape_listing(appid):
+            async with listing_semaphore:
+                await _scrape_listing(appid)
+
+        async def _scrape_listing(appid):
+            app_name = app_names[appid]
             curator_page_url = f"https://store.steampowered.com/curators/curatorsreviewing/?appid={appid}"
 
             # open listing page for this app id
-            page = await browser.new_page()
+            page = await context.new_page()
             try:
                 await page.set_default_navigation_timeout(NAV_TIMEOUT_MS)
             except Exception:
@@ -1024,7 +844,7 @@ async def main():
             # Retry navigating to the curator page
             for attempt in range(NAV_RETRIES + 1):
                 try:
-                    await page.goto(curator_page_url, timeout=NAV_TIMEOUT_MS * 2, wait_until="networkidle")
+                    await page.goto(curator_page_url, timeout=NAV_TIMEOUT_MS * 2, wait_until="domcontentloaded")
                     break  # Exit loop if navigation succeeds
                 except Exception as e:
                     if attempt < NAV_RETRIES:
@@ -1035,180 +855,178 @@ async def main():
                         await page.close()
                         return
 
-            # Scroll the page according to mode
-            if SCROLL_UNTIL_END:
-                prev_count = 0
-                stable_rounds = 0
-                rounds = 0
-                max_rounds = 500  # safety cap in case site never reports stability
-                while rounds < max_rounds:
-                    await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                    await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
-                    curator_divs = await page.query_selector_all("div.curator_page")
-                    cur_count = len(curator_divs)
-                    print(f"[{app_name}] Scrolled (auto) round {rounds+1}; curators: {cur_count}")
-                    if cur_count == prev_count:
-                        stable_rounds += 1
-                        if stable_rounds >= 3:
-                            break
+            try:
+                # The curator blocks are in the HTML; wait for them rather than for network idle
+                # (images/trackers keep the network busy long after the DOM is ready)
+                try:
+                    await page.wait_for_selector("div.curator_page", timeout=NAV_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    print(f"[{app_name}] No curator blocks appeared within {NAV_TIMEOUT_MS // 1000}s")
+
+                # Scroll the page according to mode
+                if SCROLL_UNTIL_END:
+                    # the whole scroll/count/stability loop runs in the page (one round-trip)
+                    rounds, cur_count = await page.evaluate(
+                        SCROLL_UNTIL_END_JS, {"wait": int(WAIT_BETWEEN_SCROLLS * 1000), "maxRounds": 500}
+                    )
+                    print(f"[{app_name}] Scrolled (auto) {rounds} rounds; curators: {cur_count}")
+                else:
+                    for i in range(MAX_SCROLLS):
+                        await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+                        print(f"[{app_name}] Scrolled {i + 1} times")
+                        await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
+
+                # after scrolling read every curator block (name, link, followers, snippet) in one round-trip
+                listing = await page.eval_on_selector_all(
+                    "div.curator_page", LISTING_JS,
+                    {"appid": str(appid), "snippetSelectors": LISTING_SNIPPET_SELECTORS},
+                )
+            finally:
+                await page.close()
+            print(f"[{app_name}] Found {len(listing)} curators on page")
+
+            # queue only curators not already seen (keyed by steam_profile when available)
+            gained_keys = []
+            for entry in listing:
+                key = entry["profileLink"] if entry["profileLink"] else entry["name"]
+                if key in seen_keys:
+                    if key in queued_games:
+                        queued_games[key].add(app_name)
                     else:
-                        stable_rounds = 0
-                        prev_count = cur_count
-                    rounds += 1
-            else:
-                for i in range(MAX_SCROLLS):
-                    await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                    print(f"[{app_name}] Scrolled {i + 1} times")
-                    await asyncio.sleep(WAIT_BETWEEN_SCROLLS)
-
-            # after scrolling get the final list of curator blocks
-            curator_divs = await page.query_selector_all("div.curator_page")
-            print(f"[{app_name}] Found {len(curator_divs)} curators on page")
-
-            # build tasks only for curators not already seen (keyed by steam_profile when available)
-            tasks = []
-            keys = []
-            for curator in curator_divs:
-                name_elem = await curator.query_selector("div.name span")
-                name = (await name_elem.inner_text()).strip() if name_elem else "N/A"
-                profile_elem = await curator.query_selector("a.profile_avatar")
-                profile_link = await profile_elem.get_attribute("href") if profile_elem else ""
-                # Extract follower count from the listing block (preserve this value)
-                follower_elem = await curator.query_selector("div.followers span")
-                follower_text = (await follower_elem.inner_text()).strip() if follower_elem else "N/A"
-                key = profile_link if profile_link else name
-                if key in aggregated:
-                    aggregated[key]["games"].add(app_name)
+                        aggregated[key].games.add(app_name)
+                        gained_keys.append(key)
                     continue
-                # Try to extract a short review snippet directly from the listing block (preferred)
-                listing_snippet = ""
+                seen_keys.add(key)
+                queued_games[key] = set()
+                curator_queue.put_nowait({**entry, "key": key, "appid": appid, "app_name": app_name})
+
+            # checkpoint existing curators that gained this game
+            if gained_keys:
+                await checkpoint(gained_keys)
+
+        async def worker():
+            while True:
+                item = await curator_queue.get()
                 try:
-                    # First, look for store capsule anchors that reference this appid and extract their nearby text
+                    key = item["key"]
+                    try:
+                        res = await process_curator_by_url(
+                            item["profileLink"], item["name"], followers=item["followers"],
+                            appid=item["appid"], app_name=item["app_name"], listing_review=item["snippet"],
+                        )
+                    except Exception as e:
+                        print(f"[{item['name']}] Worker error: {e}")
+                        res = None
+                    # attach every game this curator was listed under while it waited in the queue
+                    games = {item["app_name"]} | queued_games.pop(key, set())
+                    if res:
+                        aggregated[key] = Curator(res, games)
+                        newly_added_keys.add(key)
+                        await checkpoint([key])
+                    else:
+                        # not aggregated after all: let a later listing queue it again
+                        seen_keys.discard(key)
+                finally:
+                    curator_queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(MAX_CONCURRENT)]
+        listing_results = await asyncio.gather(*(scrape_listing(appid) for appid in GAME_IDS), return_exceptions=True)
+        for appid, outcome in zip(GAME_IDS, listing_results):
+            if isinstance(outcome, Exception):
+                print(f"[ERROR] Listing scrape failed for appid {appid}: {outcome}")
+
+        # The browser is only needed for the listings: shut it down while the workers finish
+        # the remaining profile fetches and the CSV is written below
+        browser_closed = asyncio.create_task(browser.close())
+
+        # awaited even if the export fails, so Chromium is never left behind
+        try:
+            await curator_queue.join()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # Flatten aggregated results and stream them to the CSV with a 'game' column,
+            # one row at a time (no intermediate list of all rows)
+            empty_about = 0
+
+            def export_rows(items):
+                nonlocal empty_about
+                for key, entry in items:
+                    row = entry.record()
+                    row["game"] = ";".join(sorted(entry.games))
+
+                    # Ensure we have a numeric reviews value (may have been populated by worker)
                     try:
-                        anchors = await curator.query_selector_all('a.store_capsule, a.app_impression_tracked, a')
-                        for a in anchors:
-                            ds_appid = await a.get_attribute('data-ds-appid') or ''
-                            ahref = await a.get_attribute('href') or ''
-                            if (ds_appid and str(ds_appid) == str(appid)) or (f"/app/{appid}" in ahref) or (f"app={appid}" in ahref):
-                                # prefer a div.text inside the anchor or its parent
-                                txt_el = await a.query_selector('div.text')
-                                if not txt_el:
-                                    # check parent node for a div.text
-                                    parent = await a.evaluate_handle('node => node.parentElement')
-                                    try:
-                                        if parent:
-                                            txt_el = await parent.as_element().query_selector('div.text')
-                                    except Exception:
-                                        txt_el = None
-                                if txt_el:
-                                    txt = (await txt_el.inner_text() or '').strip()
-                                    if txt and 'no more reviews' not in txt.lower():
-                                        listing_snippet = txt.replace('\n', ' ')[:800]
-                                        break
+                        row["reviews"] = int(row.get("reviews") or 0)
                     except Exception:
-                        pass
-
-                    # fallback to existing selectors if we didn't find a targeted snippet
-                    if not listing_snippet:
-                        for sel in ["div.review_text", "div.curator_review", "div.recent_review", "div.review_body", "p.tagline", "div.review", "div.text"]:
-                            el = await curator.query_selector(sel)
-                            if el:
-                                txt = (await el.inner_text() or "").strip()
-                                if txt and 'no more reviews' not in txt.lower():
-                                    listing_snippet = txt.replace("\n", " ")[:800]
-                                    break
-                except Exception:
-                    listing_snippet = ""
-
-                # Immediately extract the minimal data (strings) and schedule the worker that uses only URLs/names.
-                curator_data = (profile_link, name, follower_text)
-                tasks.append(sem_task(curator_data, appid, app_name, listing_review=listing_snippet))
-                keys.append(key)
-
-            results = []
-            if tasks:
-                results = await asyncio.gather(*tasks)
-
-            # store results and attach game using the same key we checked earlier
-            for res, key in zip(results, keys):
-                if not res:
-                    continue
-                res_games = set([app_name])
-                res_record = res.copy()
-                aggregated[key] = {"data": res_record, "games": res_games}
-                newly_added_keys.add(key)
-
-            await page.close()
-
-        # Close pooled pages
-        while not page_pool.empty():
-            ppage = await page_pool.get()
-            await ppage.close()
-
-        # Flatten aggregated results and write CSV with a 'game' column
-        final_rows = []
-        for key, entry in aggregated.items():
-            row = entry["data"].copy()
-            games_field = ";".join(sorted(entry["games"]))
-            row["game"] = games_field
-
-            # Ensure we have a numeric reviews value (may have been populated by worker)
-            try:
-                row["reviews"] = int(row.get("reviews") or 0)
-            except Exception:
-                row["reviews"] = 0
+                        row["reviews"] = 0
 
-            # Validate that the email field contains a proper email pattern; clear it otherwise
-            email_val = (row.get("email") or "").strip()
-            if email_val and re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", email_val):
-                row["has_email"] = 1
-                row["email"] = email_val
-            else:
-                row["has_email"] = 0
-                row["email"] = ""
-
-            # Initialize 'about_me' with a default value to avoid scope issues
-            about_me = row.get("about_me", "[ERROR: Unable to extract 'about me' section]")
-            if not about_me:
-                about_me = "[ERROR: Unable to extract 'about me' section]"
-            print(f"[DEBUG] Final 'about_me' before saving: {about_me}")
-
-            # Apply cleaning logic to 'about_me' before saving
-            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:CURATOR|CREATOR)?\s*FOLLOWERS\b.*", "", about_me, flags=re.I)
-            about_me = re.sub(r"\n?\s*[\d,]+\s*(?:REVIEWS|REVIEWS POSTED|POSTED)\b.*", "", about_me, flags=re.I)
-            about_me = re.sub(r"\bPOSTED\b", "", about_me, flags=re.I)
-            about_me = re.sub(r"\s+", " ", about_me).strip()
-            print(f"[DEBUG] Cleaned 'about_me' before saving: {about_me}")
-            row["about_me"] = about_me
-
-            final_rows.append(row)
-
-        # Ensure there are no empty about_me cells (replace with explicit error marker)
-        empty_about = 0
-        for r in final_rows:
-            if not (r.get('about_me') or '').strip():
-                r['about_me'] = "[ERROR: Unable to extract 'about me' section]"
-                empty_about += 1
-        if empty_about:
-            print(f"[DEBUG] Replaced {empty_about} empty 'about_me' entries with error marker")
-
-        # If user requested only newly discovered curators and an input CSV was provided,
-        # filter the rows accordingly.
-        rows_to_write = final_rows
-        if getattr(args, 'export_new_only', False) and args.input_csv:
-            # determine which rows correspond to newly_added_keys
-            rows_to_write = [r for k, r in zip(aggregated.keys(), final_rows) if k in newly_added_keys]
-
-        # Save CSV (include reviews, game and has_email columns)
-        with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
-            fieldnames = ["curator_name", "steam_profile", "followers", "reviews", "external_site", "about_me", "sample_review", "email", "has_email", "game"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows_to_write)
-
-        print(f"💾 Saved {len(rows_to_write)} unique curators to {OUTPUT_FILE}")
-        await browser.close()
+                    # Validate that the email field contains a proper email pattern; clear it otherwise
+                    email_val = (row.get("email") or "").strip()
+                    if email_val and EMAIL_RE.search(email_val):
+                        row["has_email"] = 1
+                        row["email"] = email_val
+                    else:
+                        row["has_email"] = 0
+                        row["email"] = ""
+
+                    about_me = row.get("about_me") or "[ERROR: Unable to extract 'about me' section]"
+                    print(f"[DEBUG] Final 'about_me' before saving: {about_me}")
+
+                    # Apply cleaning logic to 'about_me' before saving
+                    about_me = clean_about(about_me)
+                    print(f"[DEBUG] Cleaned 'about_me' before saving: {about_me}")
+                    # Ensure there are no empty about_me cells (replace with explicit error marker)
+                    if not about_me:
+                        about_me = "[ERROR: Unable to extract 'about me' section]"
+                        empty_about += 1
+                    row["about_me"] = about_me
+                    yield row
+
+            # If user requested only newly discovered curators and an input CSV was provided,
+            # filter the rows accordingly.
+            items = aggregated.items()
+            if getattr(args, 'export_new_only', False) and args.input_csv:
+                items = ((k, e) for k, e in items if k in newly_added_keys)
+
+            # Save CSV (include reviews, game and has_email columns)
+            def write_csv():
+                written = 0
+                fieldnames = ["curator_name", "steam_profile", "followers", "reviews", "external_site", "about_me", "sample_review", "email", "has_email", "game"]
+                # plain csv.writer over pre-projected tuples (no per-row DictWriter field lookups)
+                project = operator.itemgetter(*fieldnames)
+                with open(OUTPUT_FILE, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    for row in export_rows(items):
+                        writer.writerow(project(row))
+                        written += 1
+                return written
+
+            # off the event loop, so it overlaps with the browser shutdown
+            written = await asyncio.to_thread(write_csv)
+            if empty_about:
+                print(f"[DEBUG] Replaced {empty_about} empty 'about_me' entries with error marker")
+
+            print(f"💾 Saved {written} unique curators to {OUTPUT_FILE}")
+
+            # The CSV is complete, so the checkpoint is no longer needed
+            progress_db.close()
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(progress_path + suffix)
+                except OSError:
+                    pass
+        finally:
+            await browser_closed
 
 
 if __name__ == "__main__":
+    # uvloop is optional (not available on Windows); it speeds up scheduling of the many awaits
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -8,6 +8,9 @@ an email is found and the CSV `email` is empty or invalid.
 
 Usage:
   python extract_emails_from_about.py --input curators.csv --output curators_with_emails.csv
+  python extract_emails_from_about.py --input curators.csv --format jsonl   # gzipped JSON lines for a later stage
+  python extract_emails_from_about.py --input curators.csv --workers 8     # row-by-row across 8 processes
+  python extract_emails_from_about.py --input curators.csv --vectorised     # column-wise pandas pass (opt-in)
 
 Rules:
 - Accepts typical emails (gmail, hotmail, icloud, custom domains, etc).
@@ -16,17 +19,44 @@ Rules:
 """
 import argparse
 import csv
+import gzip
+import itertools
+import json
+import multiprocessing
 import os
 import re
 import sys
 
-EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# orjson is optional too: it only speeds up --format jsonl
+try:
+    import orjson
+
+    def _dump_row(row) -> bytes:
+        return orjson.dumps(row)
+except ImportError:
+    def _dump_row(row) -> bytes:
+        return json.dumps(row, ensure_ascii=False).encode('utf-8')
+
+# pandas (installed alongside streamlit) is optional: --vectorised fills the whole CSV column-wise,
+# otherwise rows are streamed through fill_email one at a time
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from python_src.shared.emails import EMAIL_PATTERN, EMAIL_RE
+except Exception:
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    from python_src.shared.emails import EMAIL_PATTERN, EMAIL_RE
+YOUTUBE_MENTION_RE = re.compile(r"youtube|youtu\.be", re.I)
 
 def looks_like_youtube(s: str) -> bool:
     if not s:
         return False
-    s = s.lower()
-    return 'youtube' in s or 'youtu.be' in s
+    return YOUTUBE_MENTION_RE.search(s) is not None
 
 
 def find_email_in_text(text: str):
@@ -34,22 +64,25 @@ def find_email_in_text(text: str):
         return None
     # decode common URL encoding for mailto if present (basic)
     text = text.replace('%40', '@')
+    # every youtube / youtu.be mention, located once up front instead of re-scanning per match;
+    # the proximity check below only runs when 'youtube' is mentioned at all
+    # (a 7-char match is 'youtube' in any case, 8 chars is 'youtu.be'; no lowercased copies)
+    mentions = [(m.start(), m.end(), m.end() - m.start() == 7) for m in YOUTUBE_MENTION_RE.finditer(text)]
+    mentions_youtube = any(is_youtube for _, _, is_youtube in mentions)
     # find all candidates
-    for m in EMAIL_RE.findall(text):
-        if looks_like_youtube(m):
+    for m in EMAIL_RE.finditer(text):
+        email = m.group(0)
+        if looks_like_youtube(email):
             continue
         # avoid matches that include 'youtube' nearby
-        context = text.lower()
-        if 'youtube' in context:
+        if mentions_youtube:
             # if youtube mentioned, ensure the matched email isn't part of a youtube url
-            # naive: skip if 'youtube' appears within 30 chars of the match
-            idx = context.find(m.lower())
-            if idx != -1:
-                start = max(0, idx - 30)
-                end = min(len(context), idx + len(m) + 30)
-                if 'youtube' in context[start:end] or 'youtu.be' in context[start:end]:
-                    continue
-        return m
+            # naive: skip if a mention lies within 30 chars of the match
+            start = max(0, m.start() - 30)
+            end = min(len(text), m.end() + 30)
+            if any(start <= s and e <= end for s, e, _ in mentions):
+                continue
+        return email
     return None
 
 
@@ -59,24 +92,49 @@ def is_valid_email(s: str) -> bool:
     return EMAIL_RE.fullmatch(s) is not None
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Extract emails from about_me column and fill email field')
-    parser.add_argument('--input', required=True, help='Input CSV file')
-    parser.add_argument('--output', help='Output CSV path (defaults to input_filled.csv)')
-    args = parser.parse_args()
-
-    if not os.path.exists(args.input):
-        print('Input not found:', args.input)
-        sys.exit(1)
-
-    out_path = args.output or (os.path.splitext(args.input)[0] + '_emails.csv')
-
-    with open(args.input, newline='', encoding='utf-8') as f:
-        reader = list(csv.DictReader(f))
-        if not reader:
+def fill_email(row) -> bool:
+    """Fill row['email']/row['has_email'] from the row's text fields; True if an email was added."""
+    about = (row.get('about_me') or '')
+    existing = (row.get('email') or '').strip()
+    if existing and is_valid_email(existing):
+        row['has_email'] = 1
+        return False
+    found = find_email_in_text(about)
+    if found and is_valid_email(found):
+        row['email'] = found
+        row['has_email'] = 1
+        return True
+    # also try external_site or sample_review fields if present
+    ext = (row.get('external_site') or '')
+    samp = (row.get('sample_review') or '')
+    for src in (ext, samp):
+        if not found:
+            f2 = find_email_in_text(src)
+            if f2 and is_valid_email(f2):
+                row['email'] = f2
+                row['has_email'] = 1
+                return True
+    return False
+
+
+def process_row(row):
+    """Pool worker: fill one row; returns (row, whether an email was added)."""
+    return row, fill_email(row)
+
+
+def fill_streaming(in_path, tmp_path, fmt, workers=1) -> int:
+    """Row-by-row pass: rows are read, filled and written in order without loading the file.
+
+    With workers > 1 the filling fans out over a process pool (imap keeps the input order).
+    """
+    changed = 0
+    with open(in_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        first = next(reader, None)
+        if first is None:
             print('No rows in CSV')
             sys.exit(1)
-        fieldnames = list(reader[0].keys())
+        fieldnames = list(first.keys())
         # ensure email/has_email/about_me exist
         if 'about_me' not in fieldnames:
             print("Input CSV has no 'about_me' column")
@@ -85,35 +143,97 @@ def main():
         if 'has_email' not in fieldnames:
             fieldnames.append('has_email')
 
-    changed = 0
-    for row in reader:
-        about = (row.get('about_me') or '')
-        existing = (row.get('email') or '').strip()
-        if existing and is_valid_email(existing):
-            row['has_email'] = 1
-            continue
-        found = find_email_in_text(about)
-        if found and is_valid_email(found):
-            row['email'] = found
-            row['has_email'] = 1
-            changed += 1
+        if fmt == 'jsonl':
+            out = gzip.open(tmp_path, 'wb')
+            write_row = lambda row: out.write(_dump_row(row) + b'\n')
         else:
-            # also try external_site or sample_review fields if present
-            ext = (row.get('external_site') or '')
-            samp = (row.get('sample_review') or '')
-            for src in (ext, samp):
-                if not found:
-                    f2 = find_email_in_text(src)
-                    if f2 and is_valid_email(f2):
-                        row['email'] = f2
-                        row['has_email'] = 1
+            out = open(tmp_path, 'w', newline='', encoding='utf-8')
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+            write_row = writer.writerow
+        rows = itertools.chain((first,), reader)
+        pool = multiprocessing.Pool(workers) if workers > 1 else None
+        try:
+            filled = pool.imap(process_row, rows, chunksize=256) if pool else map(process_row, rows)
+            with out:
+                for row, added in filled:
+                    if added:
                         changed += 1
-                        break
+                    write_row(row)
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+    return changed
+
+
+def fill_vectorised(in_path, tmp_path, fmt) -> int:
+    """Whole-file pass with pandas string methods; same rules as fill_email.
+
+    Texts without a youtube/youtu.be mention take the first regex match directly. The few that
+    mention YouTube go through find_email_in_text for its proximity check.
+    """
+    df = pd.read_csv(in_path, dtype=object, keep_default_na=False)
+    if df.empty:
+        print('No rows in CSV')
+        sys.exit(1)
+    if 'about_me' not in df.columns:
+        print("Input CSV has no 'about_me' column")
+    for col in ('email', 'has_email'):
+        if col not in df.columns:
+            df[col] = ''
+    text_cols = [c for c in ('email', 'about_me', 'external_site', 'sample_review') if c in df.columns]
+    df[text_cols] = df[text_cols].fillna('')
+
+    valid = df['email'].str.strip().str.fullmatch(EMAIL_PATTERN)
+    df.loc[valid, 'has_email'] = 1
+    found = pd.Series(None, index=df.index, dtype=object)
+    for col in ('about_me', 'external_site', 'sample_review'):
+        if col not in df.columns:
+            continue
+        text = df.loc[~valid & found.isna() & (df[col] != ''), col].str.replace('%40', '@', regex=False)
+        youtube = text.str.contains(YOUTUBE_MENTION_RE.pattern, case=False)
+        found[text.index[~youtube]] = text[~youtube].str.extract(f'({EMAIL_PATTERN})', expand=False)
+        found[text.index[youtube]] = text[youtube].map(find_email_in_text)
+
+    filled = found.notna()
+    df.loc[filled, 'email'] = found[filled]
+    df.loc[filled, 'has_email'] = 1
+    if fmt == 'jsonl':
+        df.to_json(tmp_path, orient='records', lines=True, force_ascii=False, compression='gzip')
+    else:
+        df.to_csv(tmp_path, index=False, lineterminator='\r\n')  # same line endings as csv.DictWriter
+    return int(filled.sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract emails from about_me column and fill email field')
+    parser.add_argument('--input', required=True, help='Input CSV file')
+    parser.add_argument('--output', help='Output path (defaults to input_emails.csv / input_emails.jsonl.gz)')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv',
+                        help='csv (default) or gzipped JSON lines, cheaper to write for intermediate stages')
+    parser.add_argument('--vectorised', action='store_true',
+                        help='Fill the whole CSV column-wise with pandas instead of streaming rows')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes for the row-by-row path (default 1; os.cpu_count() suits large files)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print('Input not found:', args.input)
+        sys.exit(1)
 
-    with open(out_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(reader)
+    suffix = '_emails.jsonl.gz' if args.format == 'jsonl' else '_emails.csv'
+    out_path = args.output or (os.path.splitext(args.input)[0] + suffix)
+
+    # written next to the output and swapped in at the end, so --output may equal --input
+    tmp_path = out_path + '.tmp'
+    if args.vectorised and pd is None:
+        print('pandas is not installed; falling back to the row-by-row path')
+    if args.vectorised and pd is not None:
+        changed = fill_vectorised(args.input, tmp_path, args.format)
+    else:
+        changed = fill_streaming(args.input, tmp_path, args.format, max(1, args.workers))
+    os.replace(tmp_path, out_path)
 
     print(f'Wrote {out_path} (filled {changed} emails)')
 
@@ -20,7 +20,6 @@ import os
 import re
 import sys
 import time
-import urllib.parse
 from typing import List
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
@@ -28,9 +27,11 @@ from playwright.async_api import async_playwright, TimeoutError as PlaywrightTim
 try:
     from python_src.shared import csv_helpers
     from python_src.shared import paths as shared_paths
+    from python_src.shared.emails import EMAIL_RE, find_email
 except Exception:
     import csv_helpers
     import paths as shared_paths
+    from emails import EMAIL_RE, find_email
 
 # Prevent BlockingIOError when many async tasks write to stdout: make stdout blocking
 try:
@@ -70,17 +71,8 @@ async def extract_email_from_link(elem):
         return "", ""
     href = await elem.get_attribute('href') or ''
     text = (await elem.inner_text()) or ''
-    # visible text first
-    m = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
-    if m:
-        return href, m.group(0)
-    decoded = urllib.parse.unquote(href or '')
-    if decoded.lower().startswith('mailto:'):
-        return href, decoded.split('mailto:')[-1]
-    m2 = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", decoded)
-    if m2:
-        return href, m2.group(0)
-    return href, ''
+    # visible text first, then the decoded href
+    return href, find_email(text) or find_email(href) or ''
 
 
 async def extract_about_and_email_from_profile(page, name: str):
@@ -209,10 +201,7 @@ async def extract_about_and_email_from_profile(page, name: str):
             try:
                 mail_el = await page.query_selector("a[href^='mailto:']")
                 if mail_el:
-                    href = await mail_el.get_attribute('href') or ''
-                    m = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", href)
-                    if m:
-                        email_found = m.group(0)
+                    email_found = find_email(await mail_el.get_attribute('href')) or ''
             except Exception:
                 pass
 
@@ -339,13 +328,13 @@ async def main_async(args):
 
                 # if scraper found an email, write it only when CSV email is empty or invalid
                 if email:
-                    if not existing or not re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", existing):
+                    if not existing or not EMAIL_RE.search(existing):
                         rows[idx]['email'] = email
                     # mark that we have an email
                     rows[idx]['has_email'] = 1
                 else:
                     # keep existing valid email if present, otherwise clear/mark missing
-                    if existing and re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", existing):
+                    if existing and EMAIL_RE.search(existing):
                         rows[idx]['has_email'] = 1
                     else:
                         rows[idx]['email'] = ''